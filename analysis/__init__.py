@@ -14,11 +14,22 @@ Módulos:
     - load_factor_test: Teste de impacto do fator de carga (α)
     - comparative_tests: Comparações entre estruturas e implementações
 
-Uso:
-    python analysis/collision_analysis.py
-    python analysis/load_factor_test.py
-    python analysis/comparative_tests.py
+Uso (a partir da raiz do repositório, para que este __init__ rode antes):
+    python -m analysis.collision_analysis
+    python -m analysis.load_factor_test
+    python -m analysis.comparative_tests
 """
 
+import sys
+from pathlib import Path
+
+# Adicionar diretórios src e benchmarks (funções de medição compartilhadas,
+# em medicao.py) ao path uma única vez para todos os módulos
+_RAIZ = Path(__file__).parent.parent
+
+for _diretorio in (str(_RAIZ / 'benchmarks'), str(_RAIZ / 'src')):
+    if _diretorio not in sys.path:
+        sys.path.insert(0, _diretorio)
+
 __version__ = "1.0.0"
 __author__ = "Silveira et al."
@@ -8,14 +8,40 @@ Artigo: "Implementação de Estruturas de Dados Lineares"
 Autores: Silveira et al. (2025)
 """
 
-import sys
-from pathlib import Path
-
-# Adicionar diretório src ao path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+from bisect import bisect_left
+from operator import mul
 
+# O diretório src é adicionado ao path por analysis/__init__.py
 from hashtable import HashTable
 
+# Limites superiores das faixas 0 | 1-5 | 6-10 | 11-15 | 16-20 | >20
+_LIMITES_FAIXAS = [0, 5, 10, 15, 20]
+
+# Tabela para o artigo, impressa com uma única escrita no stdout
+TABELA_DISTRIBUICAO = """TABELA PARA COPIAR NO ARTIGO:
+============================================================
+
+Tabela X - Distribuição de Colisões (1.000 elementos, size=100, α=10.0)
+
++----------------------+---------------+----------------+
+| Elementos/Bucket     | Qtd Buckets   | Porcentagem    |
++----------------------+---------------+----------------+
+| 0                    | {vazios:<13} | {pct_vazios:<14.1f}% |
+| 1-5                  | {leves:<13} | {pct_leves:<14.1f}% |
+| 6-10                 | {medios:<13} | {pct_medios:<14.1f}% |
+| 11-15                | {pesados:<13} | {pct_pesados:<14.1f}% |
+| 16-20                | {muito_pesados:<13} | {pct_muito_pesados:<14.1f}% |
+| >20                  | {extremos:<13} | {pct_extremos:<14.1f}% |
++----------------------+---------------+----------------+
+
+Estatísticas:
+  Bucket mais cheio: {maximo}
+  Bucket mais vazio: {minimo}
+  Média: {media:.2f}
+  Desvio padrão: {desvio_padrao:.2f}
+  Avaliação: {qualidade}
+============================================================"""
+
 
 def analisar_distribuicao_colisoes():
     """
@@ -28,10 +54,11 @@ def analisar_distribuicao_colisoes():
     
     ht = HashTable(size=100)
     
-    # Inserir 1000 elementos (α = 10.0)
+    # Inserir 1000 elementos (α = 10.0). As chaves string são
+    # intencionais: a análise avalia o hash de chaves realistas.
     print("\nInserindo 1000 elementos em tabela size=100...")
-    for i in range(1000):
-        ht.insert(f"key{i}", i)
+    chaves = [f"key{i}" for i in range(1000)]
+    ht.bulk_insert(zip(chaves, range(1000)))
     
     distribuicao = ht.get_distribution()
     
@@ -39,13 +66,34 @@ def analisar_distribuicao_colisoes():
     print(f"Tamanho da tabela: {ht.size}")
     print(f"Fator de carga: {ht.load_factor():.2f}")
     
-    # Estatísticas por faixa
-    vazios = distribuicao.count(0)
-    leves = len([x for x in distribuicao if 1 <= x <= 5])
-    medios = len([x for x in distribuicao if 6 <= x <= 10])
-    pesados = len([x for x in distribuicao if 11 <= x <= 15])
-    muito_pesados = len([x for x in distribuicao if 16 <= x <= 20])
-    extremos = len([x for x in distribuicao if x > 20])
+    # Estatísticas em uma única passada sobre a distribuição.
+    # A média é conhecida de antemão (count/size), o que permite contar
+    # os buckets dentro de ±50% da média no mesmo laço.
+    n_buckets = len(distribuicao)
+    media = ht.count / n_buckets
+    faixa_ideal_min = media * 0.5
+    faixa_ideal_max = media * 1.5
+    
+    faixas = [0] * 6
+    soma_quadrados = 0
+    maximo = minimo = distribuicao[0]
+    dentro_faixa = 0
+    for x in distribuicao:
+        faixas[bisect_left(_LIMITES_FAIXAS, x)] += 1
+        soma_quadrados += x * x
+        if x > maximo:
+            maximo = x
+        elif x < minimo:
+            minimo = x
+        if faixa_ideal_min <= x <= faixa_ideal_max:
+            dentro_faixa += 1
+    
+    vazios, leves, medios, pesados, muito_pesados, extremos = faixas
+    
+    # Desvio padrão a partir das somas acumuladas: σ² = Σx²/n − μ²
+    variancia = soma_quadrados / n_buckets - media * media
+    desvio_padrao = max(variancia, 0.0) ** 0.5
+    pct_faixa = (dentro_faixa / n_buckets) * 100
     
     print(f"\n{'Elementos/Bucket':<20} {'Qtd Buckets':<15} {'Porcentagem':<15}")
     print("-" * 50)
@@ -56,15 +104,6 @@ def analisar_distribuicao_colisoes():
     print(f"{'16-20':<20} {muito_pesados:<15} {muito_pesados/100*100:<15.1f}%")
     print(f"{'>20':<20} {extremos:<15} {extremos/100*100:<15.1f}%")
     
-    # Estatísticas adicionais
-    maximo = max(distribuicao)
-    minimo = min(distribuicao)
-    media = sum(distribuicao) / len(distribuicao)
-    
-    # Calcular desvio padrão
-    variancia = sum((x - media) ** 2 for x in distribuicao) / len(distribuicao)
-    desvio_padrao = variancia ** 0.5
-    
     print(f"\nEstatísticas:")
     print(f"  Bucket mais cheio: {maximo} elementos")
     print(f"  Bucket mais vazio: {minimo} elementos")
@@ -89,40 +128,20 @@ def analisar_distribuicao_colisoes():
     else:
         print(f"  ⚠️  {vazios}% de buckets vazios (desperdício)")
     
-    # Calcular porcentagem dentro de ±50% da média
-    faixa_ideal_min = media * 0.5
-    faixa_ideal_max = media * 1.5
-    dentro_faixa = len([x for x in distribuicao if faixa_ideal_min <= x <= faixa_ideal_max])
-    pct_faixa = (dentro_faixa / len(distribuicao)) * 100
-    
     print(f"\nUniformidade:")
     print(f"  {pct_faixa:.1f}% dos buckets estão dentro de ±50% da média")
     print(f"  Desvio padrão representa {(desvio_padrao/media)*100:.1f}% da média")
     
     print("\n" + "="*60)
-    print("TABELA PARA COPIAR NO ARTIGO:")
-    print("="*60)
-    print("")
-    print("Tabela X - Distribuição de Colisões (1.000 elementos, size=100, α=10.0)")
-    print("")
-    print("+----------------------+---------------+----------------+")
-    print("| Elementos/Bucket     | Qtd Buckets   | Porcentagem    |")
-    print("+----------------------+---------------+----------------+")
-    print(f"| 0                    | {vazios:<13} | {vazios/100*100:<14.1f}% |")
-    print(f"| 1-5                  | {leves:<13} | {leves/100*100:<14.1f}% |")
-    print(f"| 6-10                 | {medios:<13} | {medios/100*100:<14.1f}% |")
-    print(f"| 11-15                | {pesados:<13} | {pesados/100*100:<14.1f}% |")
-    print(f"| 16-20                | {muito_pesados:<13} | {muito_pesados/100*100:<14.1f}% |")
-    print(f"| >20                  | {extremos:<13} | {extremos/100*100:<14.1f}% |")
-    print("+----------------------+---------------+----------------+")
-    print("")
-    print("Estatísticas:")
-    print(f"  Bucket mais cheio: {maximo}")
-    print(f"  Bucket mais vazio: {minimo}")
-    print(f"  Média: {media:.2f}")
-    print(f"  Desvio padrão: {desvio_padrao:.2f}")
-    print(f"  Avaliação: {qualidade}")
-    print("="*60)
+    print(TABELA_DISTRIBUICAO.format(
+        vazios=vazios, pct_vazios=vazios/100*100,
+        leves=leves, pct_leves=leves/100*100,
+        medios=medios, pct_medios=medios/100*100,
+        pesados=pesados, pct_pesados=pesados/100*100,
+        muito_pesados=muito_pesados, pct_muito_pesados=muito_pesados/100*100,
+        extremos=extremos, pct_extremos=extremos/100*100,
+        maximo=maximo, minimo=minimo, media=media,
+        desvio_padrao=desvio_padrao, qualidade=qualidade))
     
     return {
         'distribuicao': distribuicao,
@@ -168,16 +187,18 @@ def analisar_qualidade_hash_diferentes_tamanhos():
     
     resultados = []
     
+    # Chaves geradas uma única vez para a maior configuração
+    chaves = [f"key{i}" for i in range(max(n for n, _ in configs))]
+    
     for n_elementos, tamanho in configs:
         ht = HashTable(size=tamanho)
-        
-        for i in range(n_elementos):
-            ht.insert(f"key{i}", i)
+        ht.bulk_insert(zip(chaves[:n_elementos], range(n_elementos)))
         
         distribuicao = ht.get_distribution()
-        media = sum(distribuicao) / len(distribuicao)
-        variancia = sum((x - media) ** 2 for x in distribuicao) / len(distribuicao)
-        desvio = variancia ** 0.5
+        media = ht.count / len(distribuicao)
+        # Σx² calculado por map/sum (laço em C); σ² = Σx²/n − μ²
+        variancia = sum(map(mul, distribuicao, distribuicao)) / len(distribuicao) - media * media
+        desvio = max(variancia, 0.0) ** 0.5
         
         razao = desvio / media if media > 0 else 0
         alpha = ht.load_factor()
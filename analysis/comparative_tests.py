@@ -9,17 +9,47 @@ Autores: Silveira et al. (2025)
 """
 
 import sys
-import time
-from pathlib import Path
 from collections import deque
 
-# Adicionar diretório src ao path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
-
+# Os diretórios src e benchmarks são adicionados ao path por analysis/__init__.py
+from medicao import medir_ns
 from stack import Stack
 from queue import Queue
 from hashtable import HashTable
 
+# Tabela para o artigo, impressa com uma única escrita no stdout
+TABELA_ESTRUTURAS = """TABELA PARA COPIAR NO ARTIGO:
+============================================================
+
+Tabela X - Comparação de Desempenho (100.000 elementos)
+
++---------------+---------------+------------------+--------------+
+| Estrutura     | Tempo (μs)    | Memória (bytes)  | Overhead     |
++---------------+---------------+------------------+--------------+
+| Pilha         | {tempo_pilha:<13.4f} | {mem_pilha:<16.2f} | 1.0x         |
+| Fila          | {tempo_fila:<13.4f} | {mem_fila:<16.2f} | {overhead_fila:<12.2f}x |
+| Hashtable     | {tempo_ht:<13.4f} | {mem_ht:<16.2f} | {overhead_ht:<12.2f}x |
++---------------+---------------+------------------+--------------+
+"""
+
+
+class FilaLista:
+    """Fila implementada com lista comum (RUIM - O(n) para remoção)."""
+    
+    def __init__(self):
+        self._items = []
+    
+    def enqueue(self, item):
+        self._items.append(item)
+    
+    def enqueue_many(self, items):
+        self._items.extend(items)
+    
+    def dequeue(self):
+        if len(self._items) == 0:
+            raise IndexError("Dequeue de fila vazia")
+        return self._items.pop(0)  # O(n) - PROBLEMA!
+
 
 def comparar_fila_deque_vs_lista():
     """
@@ -31,64 +61,62 @@ def comparar_fila_deque_vs_lista():
     print("="*60)
     print("\nEste teste mostra por que usamos deque ao invés de lista\n")
     
-    # Implementação com lista comum (RUIM - O(n) para remoção)
-    class FilaLista:
-        def __init__(self):
-            self._items = []
-        
-        def enqueue(self, item):
-            self._items.append(item)
-        
-        def dequeue(self):
-            if len(self._items) == 0:
-                raise IndexError("Dequeue de fila vazia")
-            return self._items.pop(0)  # O(n) - PROBLEMA!
-    
     tamanhos = [100, 1000, 5000, 10000]
     
-    print(f"{'Elementos':<12} {'Fila (deque)':<18} {'Lista comum':<18} {'Diferença':<12}")
-    print("-" * 60)
-    
     resultados = []
     
+    # Tabela impressa só após as medições: nenhuma escrita no terminal
+    # acontece entre uma medição e outra
+    sys.stdout.flush()
+    
     for n in tamanhos:
-        # Testar nossa fila (deque)
-        fila_deque = Queue()
-        for i in range(n):
-            fila_deque.enqueue(i)
+        def preencher(fila):
+            fila.enqueue_many(range(n))
+            return fila
         
-        start = time.perf_counter()
-        for i in range(n):
-            fila_deque.dequeue()
-        tempo_deque = (time.perf_counter() - start) * 1000  # ms
+        def esvaziar(fila):
+            dequeue = fila.dequeue
+            for i in range(n):
+                dequeue()
         
-        # Testar fila com lista
-        fila_lista = FilaLista()
-        for i in range(n):
-            fila_lista.enqueue(i)
+        # Testar nossa fila (deque), cheia a cada repetição
+        tempo_deque = medir_ns(esvaziar, preparar=lambda: preencher(Queue())) / 1e6  # ms
         
-        start = time.perf_counter()
-        for i in range(n):
-            fila_lista.dequeue()
-        tempo_lista = (time.perf_counter() - start) * 1000  # ms
+        # Testar deque puro (sem a classe Queue): custo do primitivo em C
+        def esvaziar_deque(dq):
+            popleft = dq.popleft
+            for i in range(n):
+                popleft()
         
-        razao = tempo_lista / tempo_deque
+        tempo_deque_puro = medir_ns(esvaziar_deque, preparar=lambda: deque(range(n))) / 1e6  # ms
         
-        print(f"{n:<12} {tempo_deque:<18.4f} {tempo_lista:<18.4f} {razao:<12.1f}x")
+        # Testar fila com lista
+        tempo_lista = medir_ns(esvaziar, preparar=lambda: preencher(FilaLista())) / 1e6  # ms
+        
+        razao = tempo_lista / tempo_deque
         
         resultados.append({
             'elementos': n,
             'tempo_deque': tempo_deque,
+            'tempo_deque_puro': tempo_deque_puro,
             'tempo_lista': tempo_lista,
             'razao': razao
         })
     
+    print(f"{'Elementos':<12} {'Fila (Queue)':<16} {'deque puro':<14} {'Lista comum':<16} {'Diferença':<12}")
+    print("-" * 70)
+    for r in resultados:
+        print(f"{r['elementos']:<12} {r['tempo_deque']:<16.4f} {r['tempo_deque_puro']:<14.4f} "
+              f"{r['tempo_lista']:<16.4f} {r['razao']:<12.1f}x")
+    
     print("\n" + "="*60)
     print("CONCLUSÃO:")
     print("  A lista comum fica cada vez MAIS LENTA conforme cresce")
     print("  porque pop(0) precisa mover TODOS os elementos (O(n))")
     print("")
     print("  Nossa fila com deque mantém velocidade constante O(1)")
+    print("  A diferença entre Queue e deque puro é o custo da classe")
+    print("  (chamada de método e verificação de fila vazia)")
     print("="*60)
     
     return resultados
@@ -98,6 +126,13 @@ def comparar_hashtable_vs_busca_linear():
     """
     Compara hashtable vs busca linear em lista.
     Demonstra a vantagem de O(1) vs O(n).
+    
+    A busca linear é medida de duas formas: com o laço escrito em Python
+    e com list.index(), que percorre a lista em C. A diferença entre as
+    duas é custo do interpretador, não do algoritmo. O dict nativo do
+    Python aparece como referência para a HashTable didática, e a
+    HashTable também é medida com chaves inteiras, separando o custo
+    da função hash (strings) do custo da busca no bucket.
     """
     print("\n" + "="*60)
     print("COMPARAÇÃO: HASHTABLE vs BUSCA LINEAR")
@@ -106,53 +141,95 @@ def comparar_hashtable_vs_busca_linear():
     
     tamanhos = [100, 1000, 5000, 10000]
     
-    print(f"{'Elementos':<12} {'Hashtable (μs)':<18} {'Lista (μs)':<18} {'Speedup':<12}")
-    print("-" * 60)
-    
     resultados = []
+    sys.stdout.flush()
     
     for n in tamanhos:
-        # Preparar dados
-        dados = [(f"key{i}", i*10) for i in range(n)]
+        # Preparar dados (chaves geradas uma única vez, fora da medição)
+        chaves = [f"key{i}" for i in range(n)]
+        dados = list(zip(chaves, range(0, n * 10, 10)))
         
         # Testar HASHTABLE
         ht = HashTable(size=max(10, n//10))
-        for chave, valor in dados:
-            ht.insert(chave, valor)
+        ht.bulk_insert(dados)
         
-        start = time.perf_counter()
-        for i in range(n):
-            ht.search(f"key{i}")
-        tempo_ht = (time.perf_counter() - start) / n * 1000000  # μs
+        def buscar_ht():
+            search = ht.search
+            for chave in chaves:
+                search(chave)
+        
+        tempo_ht = medir_ns(buscar_ht) / n / 1000  # μs
+        
+        # Testar HASHTABLE com chaves inteiras (hash(i) == i)
+        ht_int = HashTable(size=max(10, n//10))
+        ht_int.bulk_insert(zip(range(n), range(0, n * 10, 10)))
+        
+        def buscar_ht_int():
+            search = ht_int.search
+            for chave in range(n):
+                search(chave)
+        
+        tempo_ht_int = medir_ns(buscar_ht_int) / n / 1000  # μs
+        
+        # Testar DICT nativo (referência)
+        dicionario = dict(dados)
+        
+        def buscar_dict():
+            for chave in chaves:
+                dicionario[chave]
+        
+        tempo_dict = medir_ns(buscar_dict) / n / 1000  # μs
         
-        # Testar LISTA (busca linear)
+        # Testar LISTA (busca linear com laço Python)
         lista = dados.copy()
         
-        start = time.perf_counter()
-        for i in range(n):
-            target = f"key{i}"
-            # Busca linear
-            for chave, valor in lista:
-                if chave == target:
-                    break
-        tempo_lista = (time.perf_counter() - start) / n * 1000000  # μs
+        def buscar_lista():
+            for target in chaves:
+                # Busca linear
+                for chave, valor in lista:
+                    if chave == target:
+                        break
         
-        speedup = tempo_lista / tempo_ht
+        tempo_lista = medir_ns(buscar_lista) / n / 1000  # μs
         
-        print(f"{n:<12} {tempo_ht:<18.4f} {tempo_lista:<18.4f} {speedup:<12.1f}x")
+        # Testar LISTA (busca linear em C via list.index)
+        def buscar_index():
+            index = chaves.index
+            for target in chaves:
+                index(target)
+        
+        tempo_index = medir_ns(buscar_index) / n / 1000  # μs
+        
+        speedup = tempo_lista / tempo_ht
+        speedup_index = tempo_index / tempo_ht
         
         resultados.append({
             'elementos': n,
             'tempo_hashtable': tempo_ht,
+            'tempo_hashtable_int': tempo_ht_int,
+            'tempo_dict': tempo_dict,
             'tempo_lista': tempo_lista,
-            'speedup': speedup
+            'tempo_lista_index': tempo_index,
+            'speedup': speedup,
+            'speedup_index': speedup_index
         })
     
+    print(f"{'Elementos':<12} {'Hashtable (μs)':<16} {'HT int (μs)':<13} {'dict (μs)':<12} "
+          f"{'Lista laço (μs)':<17} {'Lista index (μs)':<18} {'Speedup':<10}")
+    print("-" * 98)
+    for r in resultados:
+        print(f"{r['elementos']:<12} {r['tempo_hashtable']:<16.4f} {r['tempo_hashtable_int']:<13.4f} "
+              f"{r['tempo_dict']:<12.4f} {r['tempo_lista']:<17.4f} {r['tempo_lista_index']:<18.4f} "
+              f"{r['speedup_index']:<10.1f}x")
+    
     print("\n" + "="*60)
     print("CONCLUSÃO:")
     print("  Hashtable mantém velocidade constante O(1)")
     print("  Lista degrada linearmente O(n) - cada busca percorre metade dos elementos")
-    print(f"  Para {tamanhos[-1]} elementos, hashtable é {resultados[-1]['speedup']:.1f}x mais rápida")
+    print("  Speedup calculado contra list.index() (busca linear em C),")
+    print("  isolando o ganho algorítmico do custo do interpretador")
+    print(f"  Para {tamanhos[-1]} elementos, hashtable é {resultados[-1]['speedup_index']:.1f}x mais rápida")
+    print(f"  (ou {resultados[-1]['speedup']:.1f}x contra a busca linear com laço Python)")
     print("="*60)
     
     return resultados
@@ -169,31 +246,48 @@ def comparar_todas_estruturas():
     
     n = 100000
     
+    def empilhar(pilha):
+        push = pilha.push
+        for i in range(n):
+            push(i)
+    
+    def enfileirar(fila):
+        enqueue = fila.enqueue
+        for i in range(n):
+            enqueue(i)
+    
+    # Valores calculados fora da medição: o laço medido não paga a
+    # multiplicação i*2 a cada inserção
+    valores = list(range(0, 2 * n, 2))
+    
+    def inserir(ht):
+        insert = ht.insert
+        for i, valor in zip(range(n), valores):
+            insert(i, valor)
+    
     # PILHA
-    pilha = Stack()
-    start = time.perf_counter()
-    for i in range(n):
-        pilha.push(i)
-    tempo_pilha = (time.perf_counter() - start) / n * 1000000
+    tempo_pilha = medir_ns(empilhar, preparar=Stack) / n / 1000
     
     # FILA
-    fila = Queue()
-    start = time.perf_counter()
-    for i in range(n):
-        fila.enqueue(i)
-    tempo_fila = (time.perf_counter() - start) / n * 1000000
+    tempo_fila = medir_ns(enfileirar, preparar=Queue) / n / 1000
     
     # HASHTABLE
-    ht = HashTable(size=10000)  # α ≈ 10
-    start = time.perf_counter()
-    for i in range(n):
-        ht.insert(i, i*2)
-    tempo_ht = (time.perf_counter() - start) / n * 1000000
+    tempo_ht = medir_ns(inserir, preparar=lambda: HashTable(size=10000)) / n / 1000  # α ≈ 10
+    
+    # Memória (estruturas preenchidas fora da medição de tempo)
+    pilha = Stack()
+    empilhar(pilha)
+    fila = Queue()
+    enfileirar(fila)
+    ht = HashTable(size=10000)
+    ht.bulk_insert(zip(range(n), valores))
     
-    # Memória
     mem_pilha = sys.getsizeof(pilha._items) / n
     mem_fila = sys.getsizeof(fila._items) / n
-    mem_ht = sum(sys.getsizeof(bucket) for bucket in ht.table) / n
+    # getsizeof de cada bucket (laço em C via map). Não dá para derivar
+    # do tamanho dos buckets: append() superaloca a lista, e a capacidade
+    # real só é visível pelo getsizeof
+    mem_ht = sum(map(sys.getsizeof, ht.table)) / n
     
     print(f"{'Estrutura':<15} {'Tempo (μs)':<15} {'Memória (bytes)':<18} {'Overhead':<12}")
     print("-" * 60)
@@ -202,19 +296,10 @@ def comparar_todas_estruturas():
     print(f"{'Hashtable':<15} {tempo_ht:<15.4f} {mem_ht:<18.2f} {mem_ht/mem_pilha:<12.2f}x")
     
     print("\n" + "="*60)
-    print("TABELA PARA COPIAR NO ARTIGO:")
-    print("="*60)
-    print("")
-    print("Tabela X - Comparação de Desempenho (100.000 elementos)")
-    print("")
-    print("+---------------+---------------+------------------+--------------+")
-    print("| Estrutura     | Tempo (μs)    | Memória (bytes)  | Overhead     |")
-    print("+---------------+---------------+------------------+--------------+")
-    print(f"| Pilha         | {tempo_pilha:<13.4f} | {mem_pilha:<16.2f} | 1.0x         |")
-    print(f"| Fila          | {tempo_fila:<13.4f} | {mem_fila:<16.2f} | {mem_fila/mem_pilha:<12.2f}x |")
-    print(f"| Hashtable     | {tempo_ht:<13.4f} | {mem_ht:<16.2f} | {mem_ht/mem_pilha:<12.2f}x |")
-    print("+---------------+---------------+------------------+--------------+")
-    print("")
+    print(TABELA_ESTRUTURAS.format(
+        tempo_pilha=tempo_pilha, mem_pilha=mem_pilha,
+        tempo_fila=tempo_fila, mem_fila=mem_fila, overhead_fila=mem_fila/mem_pilha,
+        tempo_ht=tempo_ht, mem_ht=mem_ht, overhead_ht=mem_ht/mem_pilha))
     
     print("INTERPRETAÇÃO:")
     print("  Pilha e Fila: Quase idênticas (diferença < 10%)")
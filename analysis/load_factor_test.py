@@ -9,13 +9,65 @@ Autores: Silveira et al. (2025)
 """
 
 import sys
-import time
-from pathlib import Path
-
-# Adicionar diretório src ao path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
+# Os diretórios src e benchmarks são adicionados ao path por analysis/__init__.py
 from hashtable import HashTable
+from medicao import consumir, medir_autorange_ns, medir_ns
+
+# Tabela para o artigo, impressa com uma única escrita no stdout;
+# LINHA_FATOR_CARGA é formatada com cada dicionário de resultado
+TABELA_FATOR_CARGA = """TABELA PARA COPIAR NO ARTIGO:
+============================================================
+
+Tabela X - Impacto do Fator de Carga no Desempenho (1.000 elementos)
+
++----------+----------+---------------+---------------+------------------+
+| α        | Size     | Insert (μs)   | Search (μs)   | Colisões médias  |
++----------+----------+---------------+---------------+------------------+
+{linhas}
++----------+----------+---------------+---------------+------------------+
+
+============================================================"""
+
+LINHA_FATOR_CARGA = ("| {alpha:<8.1f} | {size:<8} | {insert:<13.4f} | "
+                     "{search:<13.4f} | {colisoes:<16.2f} |")
+
+
+def _inserir(ht, chaves, valores):
+    """Insere chaves[i] → valores[i]; o laço é conduzido em C pelo map."""
+    consumir(map(ht.insert, chaves, valores))
+
+
+def _buscar(ht, chaves):
+    """Busca todas as chaves."""
+    consumir(map(ht.search, chaves))
+
+
+def _remover(ht, chaves):
+    """Remove todas as chaves."""
+    consumir(map(ht.delete, chaves))
+
+
+def _preenchida(size, chaves, valores):
+    """Cria uma hashtable com `size` buckets já contendo os pares."""
+    ht = HashTable(size=size)
+    ht.bulk_insert(zip(chaves, valores))
+    return ht
+
+
+def _gerar_chaves(n):
+    """
+    Gera uma única vez as chaves 0..n-1 e os valores (2*chave).
+    
+    As tuplas são compartilhadas por todas as fases (insert, search,
+    delete) e por todos os α. Não é preciso reservar espaço na tabela:
+    a HashTable por encadeamento tem número fixo de buckets e nunca
+    redimensiona durante as inserções, então nenhuma fase medida paga
+    por realocação da tabela.
+    """
+    chaves = tuple(range(n))
+    valores = tuple(range(0, 2 * n, 2))
+    return chaves, valores
 
 
 def testar_impacto_fator_carga():
@@ -31,31 +83,36 @@ def testar_impacto_fator_carga():
     n = 1000
     
     print(f"\nTestando com {n} elementos\n")
-    print(f"{'Fator α':<10} {'Size':<10} {'Insert (μs)':<15} {'Search (μs)':<15} {'Colisões médias':<18}")
-    print("-" * 68)
-    
     resultados = []
+    chaves, valores = _gerar_chaves(n)
+    
+    # Uma única instância reaproveitada em todos os α (clear/resize)
+    ht = HashTable(size=int(n / fatores[0]))
+    
+    def esvaziar():
+        ht.clear()
+        return ht
+    
+    # Tabela impressa só após as medições: nenhuma escrita no terminal
+    # acontece entre uma medição e outra
+    sys.stdout.flush()
     
     for alpha in fatores:
         size = int(n / alpha)
-        ht = HashTable(size=size)
+        ht.clear()
+        ht.resize(size)
         
-        # Medir INSERT
-        start = time.perf_counter()
-        for i in range(n):
-            ht.insert(i, i*2)
-        tempo_insert = (time.perf_counter() - start) / n * 1000000
+        # Medir INSERT (tabela esvaziada a cada repetição)
+        tempo_insert = medir_ns(lambda ht: _inserir(ht, chaves, valores),
+                                 preparar=esvaziar) / n / 1000
         
-        # Medir SEARCH
-        start = time.perf_counter()
-        for i in range(n):
-            ht.search(i)
-        tempo_search = (time.perf_counter() - start) / n * 1000000
+        # Medir SEARCH (a última repetição do insert deixou a tabela cheia)
+        tempo_search = medir_ns(lambda: _buscar(ht, chaves)) / n / 1000
         
         # Calcular média de elementos por bucket não-vazio
         distribuicao = ht.get_distribution()
-        buckets_com_elementos = [x for x in distribuicao if x > 0]
-        media_colisoes = sum(buckets_com_elementos) / len(buckets_com_elementos) if buckets_com_elementos else 0
+        buckets_com_elementos = len(distribuicao) - distribuicao.count(0)
+        media_colisoes = ht.count / buckets_com_elementos if buckets_com_elementos else 0
         
         resultados.append({
             'alpha': alpha,
@@ -64,8 +121,11 @@ def testar_impacto_fator_carga():
             'search': tempo_search,
             'colisoes': media_colisoes
         })
-        
-        print(f"{alpha:<10.1f} {size:<10} {tempo_insert:<15.4f} {tempo_search:<15.4f} {media_colisoes:<18.2f}")
+    
+    print(f"{'Fator α':<10} {'Size':<10} {'Insert (μs)':<15} {'Search (μs)':<15} {'Colisões médias':<18}")
+    print("-" * 68)
+    for r in resultados:
+        print(f"{r['alpha']:<10.1f} {r['size']:<10} {r['insert']:<15.4f} {r['search']:<15.4f} {r['colisoes']:<18.2f}")
     
     # ANÁLISE
     print("\n" + "="*60)
@@ -128,19 +188,8 @@ def testar_impacto_fator_carga():
         print(f"  ✗ Degradação severa ({degradacao:.1f}%) - α>2 inviável")
     
     print("\n" + "="*60)
-    print("TABELA PARA COPIAR NO ARTIGO:")
-    print("="*60)
-    print("")
-    print("Tabela X - Impacto do Fator de Carga no Desempenho (1.000 elementos)")
-    print("")
-    print("+----------+----------+---------------+---------------+------------------+")
-    print("| α        | Size     | Insert (μs)   | Search (μs)   | Colisões médias  |")
-    print("+----------+----------+---------------+---------------+------------------+")
-    for r in resultados:
-        print(f"| {r['alpha']:<8.1f} | {r['size']:<8} | {r['insert']:<13.4f} | {r['search']:<13.4f} | {r['colisoes']:<16.2f} |")
-    print("+----------+----------+---------------+---------------+------------------+")
-    print("")
-    print("="*60)
+    linhas = "\n".join(LINHA_FATOR_CARGA.format(**r) for r in resultados)
+    print(TABELA_FATOR_CARGA.format(linhas=linhas))
     
     return resultados
 
@@ -159,34 +208,26 @@ def analisar_relacao_alpha_desempenho():
     alphas = [0.1, 0.5, 1.0, 1.5, 2.0, 3.0, 5.0, 7.0, 10.0, 15.0, 20.0]
     n = 1000
     
-    print(f"{'α':<8} {'Insert (μs)':<15} {'Search (μs)':<15} {'Delete (μs)':<15}")
-    print("-" * 53)
-    
     resultados = []
+    # Mesmas chaves para todos os α: só o tamanho da tabela varia
+    chaves, valores = _gerar_chaves(n)
+    sys.stdout.flush()
     
     for alpha in alphas:
         size = max(10, int(n / alpha))
-        ht = HashTable(size=size)
         
         # INSERT
-        start = time.perf_counter()
-        for i in range(n):
-            ht.insert(i, i*2)
-        tempo_insert = (time.perf_counter() - start) / n * 1000000
+        tempo_insert = medir_ns(lambda ht: _inserir(ht, chaves, valores),
+                                 preparar=lambda: HashTable(size=size)) / n / 1000
         
-        # SEARCH
-        start = time.perf_counter()
-        for i in range(n):
-            ht.search(i)
-        tempo_search = (time.perf_counter() - start) / n * 1000000
+        # SEARCH (não altera a tabela: number ajustado até 10 ms por amostra)
+        ht = _preenchida(size, chaves, valores)
+        tempo_search = medir_autorange_ns(lambda: _buscar(ht, chaves),
+                                          duracao_minima=0.01) / n / 1000
         
-        # DELETE
-        start = time.perf_counter()
-        for i in range(n):
-            ht.delete(i)
-        tempo_delete = (time.perf_counter() - start) / n * 1000000
-        
-        print(f"{alpha:<8.1f} {tempo_insert:<15.4f} {tempo_search:<15.4f} {tempo_delete:<15.4f}")
+        # DELETE (tabela cheia a cada repetição)
+        tempo_delete = medir_ns(lambda ht: _remover(ht, chaves),
+                                 preparar=lambda: _preenchida(size, chaves, valores)) / n / 1000
         
         resultados.append({
             'alpha': alpha,
@@ -195,6 +236,11 @@ def analisar_relacao_alpha_desempenho():
             'delete': tempo_delete
         })
     
+    print(f"{'α':<8} {'Insert (μs)':<15} {'Search (μs)':<15} {'Delete (μs)':<15}")
+    print("-" * 53)
+    for r in resultados:
+        print(f"{r['alpha']:<8.1f} {r['insert']:<15.4f} {r['search']:<15.4f} {r['delete']:<15.4f}")
+    
     print("\n" + "="*60)
     print("PONTOS-CHAVE OBSERVADOS:")
     print("="*60)
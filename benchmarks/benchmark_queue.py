@@ -8,14 +8,21 @@ Artigo: "Implementação de Estruturas de Dados Lineares"
 Autores: Silveira et al. (2025)
 """
 
+import argparse
+import gc
 import sys
 import time
+import tracemalloc
+from collections import deque
+from functools import partial
 from pathlib import Path
 
 # Adicionar diretório src ao path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 from queue import Queue
+from medicao import (aquecer, avisar_sem_pgo, consumir, fixar_cpu, medir_ns,
+                     salvar_json, salvar_tabela_csv, sem_gc)
 
 
 def benchmark_tempo_fila():
@@ -30,32 +37,30 @@ def benchmark_tempo_fila():
     
     print("\nMedindo tempo de ENQUEUE...")
     for n in tamanhos:
-        fila = Queue()
+        def enfileirar(fila):
+            consumir(map(fila.enqueue, range(n)))
         
-        start = time.perf_counter()
-        for i in range(n):
-            fila.enqueue(i)
-        tempo_total = time.perf_counter() - start
+        # Fila nova a cada repetição
+        tempo_total = medir_ns(enfileirar, preparar=Queue)
         
-        tempo_por_op = (tempo_total / n) * 1000000  # microsegundos
+        tempo_por_op = tempo_total / n / 1000  # microsegundos
         resultados_enqueue.append(tempo_por_op)
         print(f"  {n:>7} elementos: {tempo_por_op:.4f} μs/operação")
     
     print("\nMedindo tempo de DEQUEUE...")
     for n in tamanhos:
-        fila = Queue()
+        def preencher():
+            return Queue.from_iterable(range(n))
         
-        # Preencher fila
-        for i in range(n):
-            fila.enqueue(i)
+        def desenfileirar(fila):
+            dequeue = fila.dequeue
+            for _ in range(n):
+                dequeue()
         
-        # Medir dequeue
-        start = time.perf_counter()
-        for i in range(n):
-            fila.dequeue()
-        tempo_total = time.perf_counter() - start
+        # Medir dequeue (fila preenchida a cada repetição, fora da medição)
+        tempo_total = medir_ns(desenfileirar, preparar=preencher)
         
-        tempo_por_op = (tempo_total / n) * 1000000
+        tempo_por_op = tempo_total / n / 1000
         resultados_dequeue.append(tempo_por_op)
         print(f"  {n:>7} elementos: {tempo_por_op:.4f} μs/operação")
     
@@ -97,7 +102,16 @@ def benchmark_tempo_fila():
 
 
 def benchmark_memoria_fila():
-    """Mede o uso de memória da fila"""
+    """
+    Mede o uso de memória da fila.
+    
+    Duas medidas são reportadas:
+        - getsizeof: só a estrutura interna (ponteiros para os elementos)
+        - tracemalloc: tudo o que foi alocado ao criar e preencher a
+          fila, incluindo os objetos int. Inteiros de -5 a 256 vêm do
+          cache do CPython e não são alocados, por isso o valor por
+          elemento cresce com n até estabilizar
+    """
     print("\n" + "="*60)
     print("BENCHMARK DE MEMÓRIA - FILA")
     print("="*60)
@@ -105,22 +119,34 @@ def benchmark_memoria_fila():
     tamanhos = [100, 1000, 10000]
     
     print("\nMedindo uso de memória...")
-    print(f"{'Elementos':<12} {'Mem Total (KB)':<18} {'Bytes/elemento':<15}")
-    print("-" * 45)
+    print(f"{'Elementos':<12} {'Mem Total (KB)':<18} {'Bytes/elemento':<15} "
+          f"{'Alocado (KB)':<15} {'Alocado/elemento':<16}")
+    print("-" * 78)
     
     resultados = []
+    resultados_alocado = []
     
     for n in tamanhos:
+        tracemalloc.start()
         fila = Queue()
         for i in range(n):
             fila.enqueue(i)
+        alocado, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
         
+        # deque.__sizeof__ já soma o cabeçalho e todos os blocos de 64
+        # ponteiros (ex: 10.000 elementos → 157 blocos, ≈81 KiB, o valor
+        # que a tabela abaixo mostra em "KB"); os objetos int ficam de
+        # fora e aparecem na coluna do tracemalloc
         mem_total = sys.getsizeof(fila._items)
         mem_por_elemento = mem_total / n
+        alocado_por_elemento = alocado / n
         
         resultados.append(mem_por_elemento)
+        resultados_alocado.append(alocado_por_elemento)
         
-        print(f"{n:<12} {mem_total/1024:<18.2f} {mem_por_elemento:<15.2f}")
+        print(f"{n:<12} {mem_total/1024:<18.2f} {mem_por_elemento:<15.2f} "
+              f"{alocado/1024:<15.2f} {alocado_por_elemento:<16.2f}")
     
     # MÉDIA
     media = sum(resultados) / len(resultados)
@@ -131,11 +157,14 @@ def benchmark_memoria_fila():
     print(f"\nFila: {media:.2f} bytes/elemento (média)")
     print("\nOu se preferir usar o valor de 1000 elementos:")
     print(f"Fila: {resultados[1]:.2f} bytes/elemento")
+    print("\nMemória total alocada (tracemalloc, inclui os inteiros):")
+    print(f"Fila: {sum(resultados_alocado) / len(resultados_alocado):.2f} bytes/elemento (média)")
     print("="*60)
     
     return {
         'media': media,
         'resultados': resultados,
+        'resultados_tracemalloc': resultados_alocado,
         'tamanhos': tamanhos
     }
 
@@ -154,6 +183,9 @@ def comparar_fila_deque_vs_lista():
     class FilaLista:
         def __init__(self):
             self._items = []
+            # Método ligado uma vez: cada dequeue() mede o pop(0), não
+            # a busca do atributo
+            self._pop = self._items.pop
         
         def enqueue(self, item):
             self._items.append(item)
@@ -161,43 +193,65 @@ def comparar_fila_deque_vs_lista():
         def dequeue(self):
             if len(self._items) == 0:
                 raise IndexError("Dequeue de fila vazia")
-            return self._items.pop(0)  # O(n) - PROBLEMA!
+            return self._pop(0)  # O(n) - PROBLEMA!
     
     tamanhos = [100, 1000, 5000, 10000]
     
-    print(f"{'Elementos':<12} {'Fila (deque)':<18} {'Lista comum':<18} {'Diferença':<12}")
-    print("-" * 60)
+    print(f"{'Elementos':<12} {'Fila (deque)':<18} {'deque puro':<14} {'Lista comum':<18} {'Diferença':<12}")
+    print("-" * 74)
     
     resultados = []
     
     for n in tamanhos:
         # Testar nossa fila (deque)
-        fila_deque = Queue()
-        for i in range(n):
-            fila_deque.enqueue(i)
+        fila_deque = Queue.from_iterable(range(n))
         
-        start = time.perf_counter()
-        for i in range(n):
-            fila_deque.dequeue()
-        tempo_deque = (time.perf_counter() - start) * 1000  # ms
+        dequeue = fila_deque.dequeue
+        
+        # Aquecimento em uma fila descartável
+        aquecer(Queue.from_iterable(range(1024)).dequeue)
+        with sem_gc():
+            start = time.perf_counter()
+            for _ in range(n):
+                dequeue()
+            tempo_deque = (time.perf_counter() - start) * 1000  # ms
+        
+        # Testar deque puro (sem a classe Queue): separa o custo do
+        # primitivo em C do custo da chamada de método
+        dq = deque(range(n))
+        popleft = dq.popleft
+        
+        aquecer(deque(range(1024)).popleft)
+        with sem_gc():
+            start = time.perf_counter()
+            for _ in range(n):
+                popleft()
+            tempo_deque_puro = (time.perf_counter() - start) * 1000  # ms
         
         # Testar fila com lista
         fila_lista = FilaLista()
         for i in range(n):
             fila_lista.enqueue(i)
         
-        start = time.perf_counter()
-        for i in range(n):
-            fila_lista.dequeue()
-        tempo_lista = (time.perf_counter() - start) * 1000  # ms
+        dequeue = fila_lista.dequeue
+        
+        descartavel = FilaLista()
+        aquecer(partial(descartavel.enqueue, 0))
+        aquecer(descartavel.dequeue)
+        with sem_gc():
+            start = time.perf_counter()
+            for _ in range(n):
+                dequeue()
+            tempo_lista = (time.perf_counter() - start) * 1000  # ms
         
         razao = tempo_lista / tempo_deque
         
-        print(f"{n:<12} {tempo_deque:<18.4f} {tempo_lista:<18.4f} {razao:<12.1f}x")
+        print(f"{n:<12} {tempo_deque:<18.4f} {tempo_deque_puro:<14.4f} {tempo_lista:<18.4f} {razao:<12.1f}x")
         
         resultados.append({
             'elementos': n,
             'tempo_deque': tempo_deque,
+            'tempo_deque_puro': tempo_deque_puro,
             'tempo_lista': tempo_lista,
             'razao': razao
         })
@@ -208,6 +262,8 @@ def comparar_fila_deque_vs_lista():
     print("  porque pop(0) precisa mover TODOS os elementos (O(n))")
     print("")
     print("  Nossa fila com deque mantém velocidade constante O(1)")
+    print("  A diferença entre Fila (deque) e deque puro é o custo da classe")
+    print("  (chamada de método e verificação de fila vazia)")
     print("="*60)
     
     return resultados
@@ -218,17 +274,23 @@ def executar_todos_benchmarks():
     print("="*70)
     print("BENCHMARKS COMPLETOS - FILA")
     print("="*70)
+    avisar_sem_pgo()
+    fixar_cpu()
     
     resultados = {}
     
-    # 1. Benchmark de tempo
-    resultados['tempo'] = benchmark_tempo_fila()
-    
-    # 2. Benchmark de memória
-    resultados['memoria'] = benchmark_memoria_fila()
+    # As seções rodam em sequência, no mesmo processo: em paralelo,
+    # disputariam CPU e cache e contaminariam os tempos umas das outras.
+    # O gc.collect() entre elas descarta o lixo deixado pela anterior.
+    secoes = [
+        ('tempo', benchmark_tempo_fila),                   # 1. Benchmark de tempo
+        ('memoria', benchmark_memoria_fila),               # 2. Benchmark de memória
+        ('deque_vs_lista', comparar_fila_deque_vs_lista),  # 3. Comparação deque vs lista
+    ]
     
-    # 3. Comparação deque vs lista
-    resultados['deque_vs_lista'] = comparar_fila_deque_vs_lista()
+    for nome, secao in secoes:
+        gc.collect()
+        resultados[nome] = secao()
     
     print("\n" + "="*70)
     print("TODOS OS BENCHMARKS CONCLUÍDOS!")
@@ -238,4 +300,16 @@ def executar_todos_benchmarks():
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmarks da Fila")
+    parser.add_argument('--json', metavar='ARQUIVO',
+                        help="grava todos os resultados em JSON")
+    parser.add_argument('--csv', metavar='ARQUIVO',
+                        help="grava a tabela de tempo (μs/operação) em CSV")
+    args = parser.parse_args()
+    
     resultados = executar_todos_benchmarks()
+    
+    if args.json:
+        salvar_json(resultados, args.json)
+    if args.csv:
+        salvar_tabela_csv(resultados['tempo'], ['enqueue', 'dequeue'], args.csv)
@@ -0,0 +1,276 @@
+"""
+Funções de Medição Compartilhadas pelos Benchmarks
+
+Os benchmarks de Pilha, Fila e Hashtable medem os tempos com as
+funções deste módulo, baseadas no timeit, em vez de envolver cada
+laço em duas chamadas a time.perf_counter().
+
+Artigo: "Implementação de Estruturas de Dados Lineares"
+Autores: Silveira et al. (2025)
+"""
+
+import csv
+import gc
+import json
+import os
+import sys
+import sysconfig
+import time
+import timeit
+from collections import deque
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def interpretador_com_pgo():
+    """
+    Indica se o CPython em uso foi compilado com PGO.
+    
+    Os laços medidos são dominados pelo laço de avaliação de bytecode
+    do interpretador; um build com --enable-optimizations (PGO) reordena
+    esse código a partir de um perfil de execução e reduz seu custo.
+    
+    Returns:
+        bool: True se a configuração do build indicar PGO
+    """
+    config = sysconfig.get_config_var('CONFIG_ARGS') or ''
+    cflags = sysconfig.get_config_var('PY_CFLAGS_NODIST') or ''
+    return '--enable-optimizations' in config or '-fprofile-use' in cflags
+
+
+def avisar_sem_pgo():
+    """Imprime um aviso se o interpretador não foi compilado com PGO."""
+    if not interpretador_com_pgo():
+        print("\nNota: CPython sem PGO; os tempos incluem um custo maior de")
+        print("despacho de bytecode. Para medições comparáveis, use um build com")
+        print("./configure --enable-optimizations --with-lto (ver README).")
+
+
+def fixar_cpu(nucleo=0, prioridade=-5):
+    """
+    Fixa o processo em um único núcleo e aumenta sua prioridade.
+    
+    Se o escalonador mover o processo de núcleo entre as medições, as
+    caches L1/L2 são perdidas e os tempos oscilam. Com o processo fixo
+    em um núcleo e com prioridade maior, a variação entre execuções
+    diminui. Equivale a rodar com `taskset -c 0 nice -n -5 python ...`.
+    
+    Em sistemas sem sched_setaffinity (macOS, Windows) o processo não é
+    fixado; sem permissão para reduzir o nice, apenas imprime uma dica.
+    
+    Args:
+        nucleo (int): Núcleo em que o processo roda. Default: 0
+        prioridade (int): Incremento do nice (negativo = mais prioridade).
+                          Default: -5
+    """
+    try:
+        os.sched_setaffinity(0, {nucleo})
+    except (AttributeError, OSError):
+        pass
+    
+    try:
+        os.nice(prioridade)
+    except (AttributeError, OSError):
+        print("\nDica: sem permissão para aumentar a prioridade; rode com sudo")
+        print(f"ou com taskset -c {nucleo} nice -n {prioridade} python ...")
+
+
+def aquecer(operacao, repeticoes=1024):
+    """
+    Executa uma operação algumas vezes antes de um trecho medido.
+    
+    O interpretador adaptativo do CPython 3.11+ (PEP 659) especializa o
+    bytecode dos métodos depois das primeiras execuções; sem aquecimento,
+    a primeira medição paga por essa especialização. Use uma estrutura
+    descartável (ou uma operação que não altere o estado) para não mexer
+    na estrutura que será medida. medir_ns e medir_autorange_ns não
+    precisam disso: as primeiras repetições aquecem o código e o mínimo
+    as descarta.
+    
+    Args:
+        operacao: Função sem argumentos (ex: Stack().push com partial,
+                  ou o pop de uma pilha descartável já preenchida)
+        repeticoes (int): Número de execuções. Default: 1024
+    """
+    for _ in range(repeticoes):
+        operacao()
+
+
+@contextmanager
+def sem_gc():
+    """
+    Desliga o coletor de lixo durante um trecho medido com perf_counter().
+    
+    Uma coleta disparada no meio da medição soma uma pausa que não tem
+    relação com a operação medida. O gc.collect() inicial faz cada
+    trecho partir do mesmo estado do heap; ao sair, o GC volta ao estado
+    anterior. As funções baseadas no timeit (medir_ns, medir_autorange_ns)
+    já desligam o GC por conta própria.
+    
+    Examples:
+        >>> with sem_gc():
+        ...     start = time.perf_counter()
+        ...     consumir(map(pilha.push, range(n)))
+        ...     tempo_total = time.perf_counter() - start
+    """
+    gc.collect()
+    estava_ligado = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if estava_ligado:
+            gc.enable()
+
+
+def pico_rss_kb():
+    """
+    Retorna o pico de memória residente (RSS) do processo, em KB.
+    
+    Serve de conferência para as contas feitas com getsizeof e
+    tracemalloc: inclui o interpretador e tudo o que o processo já
+    alocou, então só cresce ao longo da execução.
+    
+    No Linux o valor vem de VmHWM em /proc/self/status: o ru_maxrss do
+    getrusage() é herdado do processo pai no fork/exec, e um processo
+    filho lançado para medir memória reportaria o pico do pai.
+    
+    Returns:
+        float | None: Pico de RSS em KB, ou None se nem /proc nem o
+                      módulo resource estiverem disponíveis (Windows)
+    """
+    try:
+        with open('/proc/self/status', encoding='ascii') as status:
+            for linha in status:
+                if linha.startswith('VmHWM:'):
+                    return float(linha.split()[1])
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss é dado em bytes no macOS e em KB no Linux
+    return pico / 1024 if sys.platform == 'darwin' else float(pico)
+
+
+def consumir(iteravel):
+    """
+    Esgota um iterável em C, descartando os resultados.
+    
+    Usado com map() nos laços medidos: `consumir(map(pilha.push, range(n)))`
+    chama push() para cada elemento sem o despacho de bytecode do laço
+    for e sem montar uma lista de resultados, como faria list(map(...)).
+    """
+    deque(iteravel, maxlen=0)
+
+
+def medir_ns(operacao, preparar=None, repeticoes=7):
+    """
+    Mede o menor tempo de várias execuções de uma operação.
+    
+    Cada repetição executa a operação uma única vez. Use para operações
+    que consomem ou alteram o estado (ex: pop(), dequeue(), delete()),
+    recriando esse estado com `preparar` fora da medição. O mínimo de
+    k repetições descarta o ruído que só acrescenta tempo (coletas do
+    GC, escalonamento do SO). O timeit já desliga o GC durante cada
+    execução; o gc.collect() inicial faz todas partirem do mesmo estado
+    do heap.
+    
+    Args:
+        operacao: Função com o trecho medido. Se `preparar` for
+                  informado, recebe o objeto retornado por ele.
+        preparar: Função chamada antes de cada repetição, fora da
+                  medição, para recriar o estado consumido pela operação.
+        repeticoes (int): Número de repetições. Default: 7
+    
+    Returns:
+        int: Menor tempo observado, em nanossegundos
+    """
+    if preparar is None:
+        stmt, setup = operacao, "pass"
+    else:
+        estado = {}
+        
+        def setup():
+            estado['obj'] = preparar()
+        
+        def stmt():
+            operacao(estado['obj'])
+    
+    gc.collect()
+    return min(timeit.repeat(stmt, setup, timer=time.perf_counter_ns,
+                             repeat=repeticoes, number=1))
+
+
+def medir_autorange_ns(operacao, repeticoes=5, duracao_minima=None):
+    """
+    Mede o tempo por chamada de uma operação que não altera o estado.
+    
+    O número de execuções por amostra é calibrado com
+    timeit.Timer.autorange() (até cada amostra durar ao menos 0,2 s),
+    e o resultado é o mínimo de `repeticoes` amostras dividido por esse
+    número. Operações rápidas ficam bem acima da resolução do relógio.
+    
+    Args:
+        operacao: Função sem argumentos (ex: buscas em tabela preenchida)
+        repeticoes (int): Número de amostras. Default: 5
+        duracao_minima (float): Duração mínima de uma amostra, em
+                                segundos. Se informada, o número de
+                                execuções é multiplicado por 10 até
+                                atingi-la, em vez de usar os 0,2 s do
+                                autorange(). Default: None
+    
+    Returns:
+        float: Menor tempo por chamada de `operacao`, em nanossegundos
+    """
+    # autorange() compara a duração com 0,2 em segundos, então este
+    # Timer usa o relógio padrão (perf_counter) e converte no final
+    timer = timeit.Timer(operacao)
+    if duracao_minima is None:
+        number, _ = timer.autorange()
+    else:
+        number = 1
+        while timer.timeit(number) < duracao_minima:
+            number *= 10
+    
+    gc.collect()
+    return min(timer.repeat(repeticoes, number)) / number * 1e9
+
+
+def salvar_json(resultados, caminho):
+    """
+    Grava o dicionário retornado por executar_todos_benchmarks em JSON.
+    
+    Os scripts de gráficos podem ler os números diretamente, sem
+    interpretar as tabelas impressas no terminal.
+    
+    Args:
+        resultados (dict): Resultados de todas as seções do benchmark
+        caminho (str): Arquivo de saída
+    """
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        json.dump(resultados, arquivo, indent=2, ensure_ascii=False)
+
+
+def salvar_tabela_csv(tempo, operacoes, caminho):
+    """
+    Grava a tabela de tempo (μs/operação por tamanho) em CSV.
+    
+    Uma linha por operação e uma coluna por tamanho, na mesma
+    disposição da "Tabela X" impressa para o artigo.
+    
+    Args:
+        tempo (dict): Resultado do benchmark de tempo, com a lista de
+                      tempos de cada operação e a chave 'tamanhos'
+        operacoes (list): Nomes das operações, na ordem das linhas
+        caminho (str): Arquivo de saída
+    """
+    with open(caminho, 'w', newline='', encoding='utf-8') as arquivo:
+        escritor = csv.writer(arquivo)
+        escritor.writerow(['operacao', *tempo['tamanhos']])
+        for operacao in operacoes:
+            escritor.writerow([operacao, *(f"{t:.4f}" for t in tempo[operacao])])
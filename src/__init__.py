@@ -17,9 +17,10 @@ Autores:
 Ano: 2025
 
 Uso:
-    from src.stack import Stack
+    from src.stack import Stack, IntStack
     from src.queue import Queue
     from src.hashtable import HashTable
+    from src.open_hashtable import OpenAddressingHashTable, IntHashTable
     
     pilha = Stack()
     fila = Queue()
@@ -28,8 +29,10 @@ Uso:
 
 __version__ = "1.0.0"
 __author__ = "Silveira et al."
-__all__ = ['Stack', 'Queue', 'HashTable']
+__all__ = ['Stack', 'IntStack', 'Queue', 'HashTable', 'OpenAddressingHashTable',
+           'IntHashTable']
 
-from .stack import Stack
+from .stack import IntStack, Stack
 from .queue import Queue
 from .hashtable import HashTable
+from .open_hashtable import IntHashTable, OpenAddressingHashTable
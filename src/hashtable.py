@@ -7,6 +7,9 @@ Este módulo faz parte do artigo:
 Autores: Silveira et al. (2025)
 """
 
+from array import array
+from itertools import islice
+
 
 class HashTable:
     """
@@ -16,7 +19,14 @@ class HashTable:
     operações de inserção, busca e remoção em tempo O(1) médio.
     
     Método de resolução de colisões:
-        - Encadeamento: cada bucket armazena uma lista de pares (chave, valor)
+        - Encadeamento: cada bucket armazena uma lista de entradas
+          (hash, chave, valor)
+        - O hash de cada chave fica guardado na entrada; ao percorrer o
+          bucket, compara-se primeiro o hash (inteiro) e só depois a chave,
+          evitando comparações caras (ex: strings longas) na maioria dos nós
+        - Com hashes iguais, testa-se a identidade (`is`) antes de `==`,
+          como no dict do CPython: buscar com o mesmo objeto usado na
+          inserção dispensa a chamada a __eq__
     
     Função hash:
         - hash(chave) % tamanho
@@ -26,12 +36,27 @@ class HashTable:
         - insert(): O(1) médio, O(1+α) considerando colisões
         - search(): O(1) médio, O(1+α) considerando colisões
         - delete(): O(1) médio, O(1+α) considerando colisões
+        - bulk_insert(): O(k) médio para k pares
+        - clear(): O(size + count)
+        - resize(): O(size + count)
         onde α é o fator de carga (elementos/tamanho)
     
+    Crescimento automático:
+        - Desligado por padrão: os experimentos do artigo fixam o número
+          de buckets para medir o efeito de α
+        - Com max_load_factor, insert() e bulk_insert() dobram o número
+          de buckets sempre que α passa do limite, mantendo as operações
+          em O(1) amortizado independentemente do tamanho inicial
+    
     Attributes:
         size (int): Número de buckets na tabela
-        table (list): Lista de listas (buckets) contendo pares (chave, valor)
+        table (list): Lista de listas (buckets) contendo entradas
+                      (hash, chave, valor)
         count (int): Número total de elementos armazenados
+        max_load_factor (float | None): α máximo antes de dobrar a
+                                        tabela (None: sem crescimento)
+        _counts (array): Número de elementos em cada bucket, mantido a
+                         cada inserção/remoção para get_distribution()
     
     Examples:
         >>> ht = HashTable(size=10)
@@ -42,24 +67,46 @@ class HashTable:
         0.1
     """
     
-    def __init__(self, size=10):
+    __slots__ = ('size', 'table', 'count', 'max_load_factor', '_counts')
+    
+    def __init__(self, size=10, max_load_factor=None):
         """
         Inicializa a hashtable com tamanho especificado.
         
         Args:
             size (int): Tamanho inicial da tabela (número de buckets).
                        Default: 10
+            max_load_factor (float): Fator de carga que dispara o
+                       crescimento automático (ex: 0.75). Default: None,
+                       a tabela mantém `size` buckets
+        
+        Raises:
+            ValueError: Se max_load_factor não for positivo
         """
+        if max_load_factor is not None and max_load_factor <= 0:
+            raise ValueError("O fator de carga máximo deve ser positivo")
+        
+        self.max_load_factor = max_load_factor
         self.size = size
         self.table = [[] for _ in range(size)]
         self.count = 0
+        self._counts = array('i', [0]) * size
     
     def _hash_function(self, key):
         """
         Calcula o índice do bucket para uma chave.
         
         Utiliza a função hash() nativa do Python combinada com operador
-        módulo para mapear a chave para um índice válido.
+        módulo para mapear a chave para um índice válido. insert(),
+        search() e delete() aplicam o mesmo cálculo sobre o hash que
+        guardam na entrada.
+        
+        O módulo é mantido (em vez de `hash & (size - 1)`) porque o
+        número de buckets é escolhido por quem cria a tabela e não
+        precisa ser potência de dois: os experimentos usam tamanhos
+        como 7, 10 e 100 para controlar α. A máscara só vale para
+        potências de dois; OpenAddressingHashTable, que controla a
+        própria capacidade, usa a máscara.
         
         Args:
             key: Chave a ser hasheada (deve ser hashable)
@@ -87,17 +134,114 @@ class HashTable:
             O(1) médio, O(1+α) no pior caso
             onde α = count/size (elementos por bucket em média)
         """
-        index = self._hash_function(key)
+        h = hash(key)
+        index = h % self.size
+        bucket = self.table[index]
         
         # Verifica se chave já existe (atualizar)
-        for i, (k, v) in enumerate(self.table[index]):
-            if k == key:
-                self.table[index][i] = (key, value)
+        for i, (hk, k, v) in enumerate(bucket):
+            if hk == h and (k is key or k == key):
+                bucket[i] = (h, key, value)
                 return
         
         # Adiciona novo par
-        self.table[index].append((key, value))
+        bucket.append((h, key, value))
+        self._counts[index] += 1
         self.count += 1
+        
+        if self.max_load_factor is not None and self.count > self.size * self.max_load_factor:
+            self.resize(self.size * 2)
+    
+    def bulk_insert(self, items):
+        """
+        Insere vários pares chave-valor de uma só vez.
+        
+        Equivale a chamar insert() para cada par, mas executa o laço
+        inteiro em um único frame, com a tabela e o tamanho em variáveis
+        locais, sem a chamada de método e as buscas de atributo que
+        insert() paga a cada elemento.
+        
+        Args:
+            items: Iterável de pares (chave, valor)
+        
+        Complexity:
+            O(k) médio para k pares, O(k(1+α)) considerando colisões
+        """
+        table = self.table
+        size = self.size
+        counts = self._counts
+        count = self.count
+        try:
+            for key, value in items:
+                h = hash(key)
+                index = h % size
+                bucket = table[index]
+                for i, (hk, k, v) in enumerate(bucket):
+                    if hk == h and (k is key or k == key):
+                        bucket[i] = (h, key, value)
+                        break
+                else:
+                    bucket.append((h, key, value))
+                    counts[index] += 1
+                    count += 1
+        finally:
+            # Mantém count consistente mesmo se uma chave não for hashable
+            self.count = count
+        
+        # Cresce uma única vez ao final do lote, direto para o tamanho final
+        if self.max_load_factor is not None and count > size * self.max_load_factor:
+            while count > size * self.max_load_factor:
+                size *= 2
+            self.resize(size)
+    
+    def clear(self):
+        """
+        Remove todos os elementos, mantendo o número de buckets.
+        
+        Permite reaproveitar a mesma instância entre medições sem
+        construir uma nova hashtable a cada rodada. Os buckets são
+        esvaziados no lugar: as listas existentes são reaproveitadas
+        em vez de alocar `size` listas novas.
+        
+        Complexity:
+            O(size + count)
+        """
+        for bucket in self.table:
+            bucket.clear()
+        self._counts = array('i', [0]) * self.size
+        self.count = 0
+    
+    def resize(self, new_size):
+        """
+        Altera o número de buckets, redistribuindo os elementos.
+        
+        Os elementos são realocados pelo hash guardado em cada entrada,
+        sem chamar hash() novamente. Em uma tabela vazia o custo é apenas
+        o da alocação dos novos buckets.
+        
+        Args:
+            new_size (int): Novo número de buckets (deve ser > 0)
+        
+        Raises:
+            ValueError: Se new_size não for positivo
+        
+        Complexity:
+            O(new_size + count)
+        """
+        if new_size <= 0:
+            raise ValueError("O tamanho da tabela deve ser positivo")
+        
+        table = [[] for _ in range(new_size)]
+        counts = array('i', [0]) * new_size
+        for bucket in self.table:
+            for entry in bucket:
+                index = entry[0] % new_size
+                table[index].append(entry)
+                counts[index] += 1
+        
+        self.size = new_size
+        self.table = table
+        self._counts = counts
     
     def search(self, key):
         """
@@ -110,18 +254,19 @@ class HashTable:
             Valor associado à chave
         
         Raises:
-            KeyError: Se a chave não for encontrada
+            KeyError: Se a chave não for encontrada (args: a chave, como em dict)
         
         Complexity:
             O(1) médio, O(1+α) no pior caso
         """
-        index = self._hash_function(key)
+        h = hash(key)
+        index = h % self.size
         
-        for k, v in self.table[index]:
-            if k == key:
+        for hk, k, v in self.table[index]:
+            if hk == h and (k is key or k == key):
                 return v
         
-        raise KeyError(f"Chave '{key}' não encontrada")
+        raise KeyError(key)
     
     def delete(self, key):
         """
@@ -134,20 +279,23 @@ class HashTable:
             Valor que foi removido
         
         Raises:
-            KeyError: Se a chave não for encontrada
+            KeyError: Se a chave não for encontrada (args: a chave, como em dict)
         
         Complexity:
             O(1) médio, O(1+α) no pior caso
         """
-        index = self._hash_function(key)
+        h = hash(key)
+        index = h % self.size
+        bucket = self.table[index]
         
-        for i, (k, v) in enumerate(self.table[index]):
-            if k == key:
-                del self.table[index][i]
+        for i, (hk, k, v) in enumerate(bucket):
+            if hk == h and (k is key or k == key):
+                del bucket[i]
+                self._counts[index] -= 1
                 self.count -= 1
                 return v
         
-        raise KeyError(f"Chave '{key}' não encontrada")
+        raise KeyError(key)
     
     def load_factor(self):
         """
@@ -171,36 +319,75 @@ class HashTable:
         Útil para análise de qualidade da função hash e uniformidade
         da distribuição de colisões.
         
+        Os tamanhos são mantidos em _counts a cada inserção/remoção, então
+        não é preciso percorrer os buckets: basta copiar o array (em C).
+        A cópia continua compacta (4 bytes por bucket), sem criar um int
+        Python para cada bucket como faria uma lista; ela aceita len(),
+        índices, iteração, sum() e count() como uma lista.
+        
         Returns:
-            list: Lista com o número de elementos em cada bucket
+            array: array('i') com o número de elementos em cada bucket
+                   (use .tolist() se precisar de uma lista)
         
         Complexity:
-            O(size)
+            O(size), uma cópia em C sem acessar os buckets
         
         Example:
             >>> ht.get_distribution()
-            [3, 2, 0, 1, 2, ...]  # bucket 0 tem 3 elem, bucket 1 tem 2, etc
+            array('i', [3, 2, 0, 1, 2, ...])  # bucket 0 tem 3 elem, bucket 1 tem 2, etc
         """
-        return [len(bucket) for bucket in self.table]
+        return self._counts[:]
     
-    def __repr__(self):
-        """Representação em string da hashtable para debugging."""
-        items = []
+    def items(self):
+        """
+        Percorre os pares (chave, valor) armazenados, bucket a bucket.
+        
+        É um gerador: não monta uma lista com todas as entradas. A ordem
+        é a dos buckets e não tem relação com a ordem de inserção.
+        
+        Yields:
+            tuple: Par (chave, valor)
+        
+        Complexity:
+            O(size + count) para percorrer tudo
+        """
         for bucket in self.table:
-            items.extend(bucket)
-        return f"HashTable(size={self.size}, count={self.count}, items={dict(items)})"
+            for _, k, v in bucket:
+                yield k, v
+    
+    def __iter__(self):
+        """Permite usar 'for chave in hashtable', como em dict."""
+        for k, _ in self.items():
+            yield k
+    
+    def __repr__(self):
+        """
+        Representação em string da hashtable para debugging.
+        
+        Mostra no máximo 5 pares, lidos de items(): em tabelas grandes
+        não percorre nem copia todos os elementos.
+        """
+        items = repr(dict(islice(self.items(), 5)))
+        if self.count > 5:
+            items = items[:-1] + ", ...}"
+        return f"HashTable(size={self.size}, count={self.count}, items={items})"
     
     def __len__(self):
         """Permite usar len(hashtable)."""
         return self.count
     
     def __contains__(self, key):
-        """Permite usar 'key in hashtable'."""
-        try:
-            self.search(key)
-            return True
-        except KeyError:
-            return False
+        """
+        Permite usar 'key in hashtable'.
+        
+        Percorre o bucket diretamente em vez de chamar search(): uma
+        chave ausente não cria nem captura um KeyError.
+        """
+        h = hash(key)
+        for hk, k, v in self.table[h % self.size]:
+            if hk == h and (k is key or k == key):
+                return True
+        return False
 
 
 if __name__ == "__main__":
@@ -241,7 +428,7 @@ if __name__ == "__main__":
     
     print(f"   Inseridos: 9 elementos em {ht_pequena.size} buckets")
     print(f"   Fator de carga: α = {ht_pequena.load_factor():.2f}")
-    print(f"   Distribuição: {ht_pequena.get_distribution()}")
+    print(f"   Distribuição: {ht_pequena.get_distribution().tolist()}")
     
     print("\n7. Operador 'in':")
     print(f"   'nome' in ht: {'nome' in ht}")
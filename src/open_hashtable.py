@@ -0,0 +1,480 @@
+"""
+Implementação de Hashtable com Endereçamento Aberto (Sondagem Quadrática)
+
+Variante da hashtable do artigo sem listas por bucket: as chaves e os
+valores ficam em dois arrays paralelos e as colisões são resolvidas
+procurando o próximo slot livre da própria tabela.
+
+Este módulo faz parte do artigo:
+"Implementação de Estruturas de Dados Lineares: Hashtable, Pilha e Fila em Python"
+
+Autores: Silveira et al. (2025)
+"""
+
+from array import array
+from itertools import islice
+
+# Estados de cada slot (guardados em um bytearray)
+EMPTY = 0
+OCCUPIED = 1
+TOMBSTONE = 2
+
+# Fator de carga máximo antes de dobrar a capacidade
+MAX_LOAD_FACTOR = 0.7
+
+# Hashing de Fibonacci: 2^64 / φ, ímpar, multiplicado pelo hash em 64 bits
+_FIBONACCI = 0x9E3779B97F4A7C15
+_MASCARA_64 = (1 << 64) - 1
+
+
+def _proxima_potencia_de_dois(n):
+    """Retorna a menor potência de dois maior ou igual a n (mínimo 1)."""
+    return 1 << max(0, n - 1).bit_length()
+
+
+class OpenAddressingHashTable:
+    """
+    Implementação de hashtable usando endereçamento aberto com sondagem quadrática.
+    
+    Cada slot guarda no máximo um par. Em uma colisão, a inserção salta
+    1, 2, 3, ... slots a partir do anterior (circular) até achar um slot
+    livre; a busca percorre a mesma sequência até achar a chave ou um
+    slot vazio. Sem listas por bucket nem tuplas por entrada, a sondagem
+    lê posições de três arrays.
+    
+    Método de resolução de colisões:
+        - Sondagem quadrática por números triangulares sobre os arrays
+          _keys, _values e _state: o i-ésimo slot visitado é
+          inicial + i(i+1)/2. Com capacidade potência de dois, a sequência
+          passa por todos os slots exatamente uma vez
+        - Na sondagem linear (passo 1) as chaves que colidem se acumulam
+          em blocos contíguos, e qualquer chave que caia dentro de um
+          bloco precisa percorrê-lo inteiro (agrupamento primário); com
+          passos crescentes, chaves de slots iniciais diferentes seguem
+          sequências diferentes
+        - A remoção marca o slot como TOMBSTONE ("lápide"): a busca
+          continua passando por ele e a inserção pode reaproveitá-lo
+    
+    Função hash:
+        - (hash(chave) * 0x9E3779B97F4A7C15 mod 2^64) >> (64 - log2(capacidade))
+        - hash() de inteiros é a identidade: com só os bits baixos,
+          chaves em passo de 16, 32, ... cairiam todas no mesmo slot.
+          A multiplicação (hashing de Fibonacci) espalha todos os bits
+          do hash nos bits altos, que viram o índice
+        - A capacidade é sempre potência de dois, então o deslocamento
+          e a máscara da sondagem substituem o operador módulo
+    
+    Complexidade:
+        - insert(): O(1) médio amortizado (inclui o crescimento da tabela)
+        - search(): O(1) médio
+        - delete(): O(1) médio
+        - clear(): O(size)
+        O número médio de sondagens cresce com α e explode perto de 1;
+        por isso a tabela dobra de tamanho quando α passa de 0.7.
+    
+    Attributes:
+        size (int): Capacidade da tabela (número de slots, potência de dois)
+        count (int): Número total de elementos armazenados
+        _mask (int): size - 1, usado para avançar a sondagem
+        _shift (int): 64 - log2(size), usado para calcular o slot inicial
+        _keys (list): Chave de cada slot
+        _values (list): Valor de cada slot
+        _state (bytearray): Estado de cada slot (EMPTY, OCCUPIED, TOMBSTONE)
+        _tombstones (int): Número de slots marcados como TOMBSTONE
+    
+    Examples:
+        >>> ht = OpenAddressingHashTable(size=8)
+        >>> ht.insert("nome", "João")
+        >>> ht.search("nome")
+        'João'
+        >>> ht.size
+        8
+    """
+    
+    __slots__ = ('size', 'count', '_mask', '_shift', '_keys', '_values',
+                 '_state', '_tombstones')
+    
+    # Valor gravado em chave e valor de um slot removido, para não
+    # manter referências aos objetos apagados
+    _LIMPO = None
+    
+    def __init__(self, size=16, expected_size=None):
+        """
+        Inicializa a hashtable vazia.
+        
+        Args:
+            size (int): Capacidade inicial, arredondada para cima até a
+                        próxima potência de dois. Default: 16
+            expected_size (int): Número de elementos previsto. Se
+                        informado, a capacidade é aumentada (se preciso)
+                        para que esses elementos caibam com α ≤ 0.7, sem
+                        nenhuma reconstrução durante as inserções.
+                        Default: None
+        """
+        if expected_size is not None:
+            size = max(size, int(expected_size / MAX_LOAD_FACTOR) + 1)
+        self._alocar(_proxima_potencia_de_dois(size))
+        self.count = 0
+        self._tombstones = 0
+    
+    @classmethod
+    def from_dict(cls, d):
+        """
+        Cria uma hashtable com os pares de um dicionário.
+        
+        A tabela já nasce com capacidade para len(d) elementos
+        (expected_size), então as inserções não disparam reconstruções.
+        
+        Args:
+            d (dict): Pares chave-valor iniciais
+        
+        Returns:
+            Nova hashtable preenchida
+        
+        Complexity:
+            O(n) médio para n pares
+        """
+        ht = cls(expected_size=len(d))
+        for key, value in d.items():
+            ht.insert(key, value)
+        return ht
+    
+    def _alocar(self, size):
+        """Cria os arrays vazios para uma capacidade `size` (potência de dois)."""
+        self.size = size
+        self._mask = size - 1
+        self._shift = 65 - size.bit_length()
+        self._keys = [None] * size
+        self._values = [None] * size
+        self._state = bytearray(size)
+    
+    def _hash_function(self, key):
+        """
+        Calcula o slot inicial da sondagem para uma chave.
+        
+        Args:
+            key: Chave a ser hasheada (deve ser hashable)
+        
+        Returns:
+            int: Índice do slot (0 a size-1)
+        
+        Complexity:
+            O(1)
+        """
+        return (hash(key) * _FIBONACCI & _MASCARA_64) >> self._shift
+    
+    def insert(self, key, value):
+        """
+        Insere um novo par chave-valor ou atualiza valor existente.
+        
+        A sondagem só para em um slot EMPTY, para garantir que a chave
+        não exista mais adiante; o par novo vai para a primeira lápide
+        encontrada no caminho, se houver, ou para esse slot vazio.
+        
+        Args:
+            key: Chave do par (deve ser hashable)
+            value: Valor associado à chave
+        
+        Complexity:
+            O(1) médio amortizado
+        """
+        keys = self._keys
+        state = self._state
+        mask = self._mask
+        index = (hash(key) * _FIBONACCI & _MASCARA_64) >> self._shift
+        passo = 1
+        livre = -1
+        
+        while state[index] != EMPTY:
+            if state[index] == OCCUPIED:
+                k = keys[index]
+                if k is key or k == key:
+                    self._values[index] = value
+                    return
+            elif livre < 0:
+                livre = index
+            index = (index + passo) & mask
+            passo += 1
+        
+        if livre < 0:
+            livre = index
+        
+        # Grava antes de atualizar os contadores: em IntHashTable, uma
+        # chave ou valor inválido levanta exceção aqui sem alterar a tabela
+        keys[livre] = key
+        self._values[livre] = value
+        if state[livre] == TOMBSTONE:
+            self._tombstones -= 1
+        state[livre] = OCCUPIED
+        self.count += 1
+        
+        # Lápides também alongam as sondagens, então contam para o limite
+        if (self.count + self._tombstones) > self.size * MAX_LOAD_FACTOR:
+            self._rehash()
+    
+    def _probe(self, key):
+        """
+        Procura o slot que guarda uma chave.
+        
+        Percorre a sequência de sondagem até achar a chave ou um slot
+        EMPTY, passando pelas lápides. Usado por search(), delete() e
+        __contains__, que assim não dependem de exceções para saber se
+        a chave existe.
+        
+        Args:
+            key: Chave procurada
+        
+        Returns:
+            int: Índice do slot da chave, ou -1 se ela não estiver na tabela
+        
+        Complexity:
+            O(1) médio
+        """
+        keys = self._keys
+        state = self._state
+        mask = self._mask
+        index = (hash(key) * _FIBONACCI & _MASCARA_64) >> self._shift
+        passo = 1
+        
+        while state[index] != EMPTY:
+            if state[index] == OCCUPIED:
+                k = keys[index]
+                if k is key or k == key:
+                    return index
+            index = (index + passo) & mask
+            passo += 1
+        
+        return -1
+    
+    def search(self, key):
+        """
+        Busca um valor pela chave.
+        
+        Args:
+            key: Chave a ser buscada
+        
+        Returns:
+            Valor associado à chave
+        
+        Raises:
+            KeyError: Se a chave não for encontrada (args: a chave, como em dict)
+        
+        Complexity:
+            O(1) médio
+        """
+        index = self._probe(key)
+        if index < 0:
+            raise KeyError(key)
+        return self._values[index]
+    
+    def delete(self, key):
+        """
+        Remove um par chave-valor da hashtable.
+        
+        O slot vira uma lápide (TOMBSTONE) em vez de voltar a EMPTY: um
+        slot vazio interromperia a sondagem de chaves que colidiram com
+        esta e foram guardadas mais adiante.
+        
+        Args:
+            key: Chave a ser removida
+        
+        Returns:
+            Valor que foi removido
+        
+        Raises:
+            KeyError: Se a chave não for encontrada (args: a chave, como em dict)
+        
+        Complexity:
+            O(1) médio
+        """
+        index = self._probe(key)
+        if index < 0:
+            raise KeyError(key)
+        
+        value = self._values[index]
+        self._keys[index] = self._LIMPO
+        self._values[index] = self._LIMPO
+        self._state[index] = TOMBSTONE
+        self.count -= 1
+        self._tombstones += 1
+        return value
+    
+    def _rehash(self):
+        """
+        Reconstrói a tabela, descartando as lápides.
+        
+        Dobra a capacidade se os elementos ocupam mais da metade do
+        limite de carga; caso contrário, a tabela estava cheia de lápides
+        e é reconstruída com a mesma capacidade.
+        
+        Complexity:
+            O(size)
+        """
+        if self.count > self.size * MAX_LOAD_FACTOR / 2:
+            self._resize(self.size * 2)
+        else:
+            self._resize(self.size)
+    
+    def _resize(self, new_size):
+        """
+        Realoca os arrays com capacidade `new_size` e reinsere os elementos.
+        
+        Args:
+            new_size (int): Nova capacidade (potência de dois)
+        
+        Complexity:
+            O(size + new_size)
+        """
+        old_keys = self._keys
+        old_values = self._values
+        old_state = self._state
+        
+        self._alocar(new_size)
+        self._tombstones = 0
+        keys = self._keys
+        values = self._values
+        state = self._state
+        mask = self._mask
+        shift = self._shift
+        
+        for key, value, estado in zip(old_keys, old_values, old_state):
+            if estado == OCCUPIED:
+                index = (hash(key) * _FIBONACCI & _MASCARA_64) >> shift
+                passo = 1
+                while state[index] != EMPTY:
+                    index = (index + passo) & mask
+                    passo += 1
+                keys[index] = key
+                values[index] = value
+                state[index] = OCCUPIED
+    
+    def clear(self):
+        """
+        Remove todos os elementos, mantendo a capacidade.
+        
+        Complexity:
+            O(size)
+        """
+        self._alocar(self.size)
+        self.count = 0
+        self._tombstones = 0
+    
+    def load_factor(self):
+        """
+        Calcula o fator de carga da hashtable.
+        
+        Returns:
+            float: Razão entre número de elementos e capacidade (sempre ≤ 0.7)
+        
+        Complexity:
+            O(1)
+        """
+        return self.count / self.size
+    
+    def items(self):
+        """
+        Percorre os pares (chave, valor) armazenados, na ordem dos slots.
+        
+        Yields:
+            tuple: Par (chave, valor)
+        
+        Complexity:
+            O(size) para percorrer tudo
+        """
+        for k, v, estado in zip(self._keys, self._values, self._state):
+            if estado == OCCUPIED:
+                yield k, v
+    
+    def __iter__(self):
+        """Permite usar 'for chave in hashtable', como em dict."""
+        for k, _ in self.items():
+            yield k
+    
+    def __repr__(self):
+        """Representação em string (no máximo 5 pares) para debugging."""
+        items = repr(dict(islice(self.items(), 5)))
+        if self.count > 5:
+            items = items[:-1] + ", ...}"
+        return f"{type(self).__name__}(size={self.size}, count={self.count}, items={items})"
+    
+    def __len__(self):
+        """Permite usar len(hashtable)."""
+        return self.count
+    
+    def __contains__(self, key):
+        """Permite usar 'key in hashtable'."""
+        return self._probe(key) >= 0
+
+
+class IntHashTable(OpenAddressingHashTable):
+    """
+    Especialização de OpenAddressingHashTable para chaves e valores inteiros.
+    
+    Mesmo algoritmo (sondagem quadrática, capacidade em potência de dois,
+    crescimento com α > 0.7), mas chaves e valores ficam em dois
+    array('q') em vez de listas: 8 bytes por slot em cada array, sem um
+    objeto int (28+ bytes) por chave e por valor guardados.
+    
+    Restrições:
+        - Chaves e valores devem ser int de 64 bits com sinal
+        - Outros tipos levantam TypeError; inteiros fora da faixa,
+          OverflowError. Nos dois casos a tabela não é alterada
+    
+    Examples:
+        >>> ht = IntHashTable()
+        >>> ht.insert(42, 1000)
+        >>> ht.search(42)
+        1000
+        >>> ht.insert("nome", 1)
+        Traceback (most recent call last):
+        ...
+        TypeError: 'str' object cannot be interpreted as an integer
+    """
+    
+    __slots__ = ()
+    
+    _LIMPO = 0
+    
+    def _alocar(self, size):
+        """Cria os arrays vazios para uma capacidade `size` (potência de dois)."""
+        self.size = size
+        self._mask = size - 1
+        self._shift = 65 - size.bit_length()
+        self._keys = array('q', [0]) * size
+        self._values = array('q', [0]) * size
+        self._state = bytearray(size)
+
+
+if __name__ == "__main__":
+    # Exemplo de uso básico
+    print("=== Demonstração da Hashtable com Endereçamento Aberto ===\n")
+    
+    ht = OpenAddressingHashTable(size=8)
+    
+    print("1. Inserindo pares chave-valor:")
+    ht.insert("nome", "João")
+    ht.insert("idade", 25)
+    ht.insert("cidade", "São Paulo")
+    print(f"   {ht}")
+    
+    print("\n2. Buscando valores:")
+    print(f"   nome: {ht.search('nome')}")
+    print(f"   idade: {ht.search('idade')}")
+    
+    print("\n3. Crescimento automático (α > 0.7 dobra a capacidade):")
+    for i in range(10):
+        ht.insert(i, i * 10)
+    print(f"   {ht.count} elementos, capacidade {ht.size}")
+    print(f"   Fator de carga: α = {ht.load_factor():.2f}")
+    
+    print("\n4. Removendo elemento (slot vira lápide):")
+    valor = ht.delete("cidade")
+    print(f"   Removido: 'cidade' = {valor}")
+    print(f"   'cidade' in ht: {'cidade' in ht}")
+    print(f"   Count: {ht.count}")
+    
+    print("\n5. Tratamento de erro:")
+    try:
+        ht.search("inexistente")
+    except KeyError as e:
+        print(f"   Exceção capturada: {e}")
@@ -23,11 +23,19 @@ class Queue:
     
     Complexidade:
         - enqueue(): O(1)
+        - enqueue_many(): O(k) para k elementos
         - dequeue(): O(1)
         - front(): O(1)
         - is_empty(): O(1)
         - size(): O(1)
     
+    Fila limitada (maxlen):
+        - Com maxlen, a fila guarda no máximo maxlen elementos: enfileirar
+          em uma fila cheia descarta o elemento da frente (o mais antigo),
+          em O(1), como um buffer circular
+        - Útil para janelas deslizantes (ex: os últimos N eventos), com
+          memória constante enquanto a fila gira
+    
     Attributes:
         _items (deque): Collections.deque contendo os elementos da fila
     
@@ -41,14 +49,49 @@ class Queue:
         20
     """
     
-    def __init__(self):
-        """Inicializa uma fila vazia."""
-        self._items = deque()
+    __slots__ = ('_items',)
+    
+    def __init__(self, maxlen=None):
+        """
+        Inicializa uma fila vazia.
+        
+        Args:
+            maxlen (int): Número máximo de elementos. Com a fila cheia,
+                          enqueue() descarta o elemento da frente.
+                          Default: None (sem limite)
+        """
+        self._items = deque(maxlen=maxlen)
+    
+    @classmethod
+    def from_iterable(cls, items, maxlen=None):
+        """
+        Cria uma fila já contendo os elementos do iterável.
+        
+        Os elementos são enfileirados na ordem do iterável (o primeiro
+        fica na frente), com uma única chamada a enqueue_many().
+        
+        Args:
+            items: Iterável com os elementos iniciais
+            maxlen (int): Número máximo de elementos; se o iterável tiver
+                          mais, ficam só os últimos maxlen. Default: None
+        
+        Returns:
+            Queue: Nova fila preenchida
+        
+        Complexity:
+            O(k) para k elementos
+        """
+        fila = cls(maxlen)
+        fila.enqueue_many(items)
+        return fila
     
     def enqueue(self, item):
         """
         Adiciona um elemento ao final da fila.
         
+        Se a fila tiver maxlen e estiver cheia, o elemento da frente é
+        descartado para abrir espaço.
+        
         Args:
             item: Elemento a ser adicionado (qualquer tipo Python)
         
@@ -57,6 +100,21 @@ class Queue:
         """
         self._items.append(item)
     
+    def enqueue_many(self, items):
+        """
+        Adiciona vários elementos ao final da fila, na ordem do iterável.
+        
+        Equivale a chamar enqueue() para cada elemento, mas o laço é
+        executado em C por deque.extend().
+        
+        Args:
+            items: Iterável com os elementos a serem adicionados
+        
+        Complexity:
+            O(k) para k elementos
+        """
+        self._items.extend(items)
+    
     def dequeue(self):
         """
         Remove e retorna o elemento da frente da fila.
@@ -70,7 +128,7 @@ class Queue:
         Complexity:
             O(1)
         """
-        if self.is_empty():
+        if not self._items:
             raise IndexError("Dequeue de fila vazia")
         return self._items.popleft()
     
@@ -87,10 +145,15 @@ class Queue:
         Complexity:
             O(1)
         """
-        if self.is_empty():
+        if not self._items:
             raise IndexError("Front de fila vazia")
         return self._items[0]
     
+    @property
+    def maxlen(self):
+        """Número máximo de elementos, ou None se a fila não tiver limite."""
+        return self._items.maxlen
+    
     def is_empty(self):
         """
         Verifica se a fila está vazia.
@@ -101,7 +164,7 @@ class Queue:
         Complexity:
             O(1)
         """
-        return len(self._items) == 0
+        return not self._items
     
     def size(self):
         """
@@ -117,11 +180,17 @@ class Queue:
     
     def __repr__(self):
         """Representação em string da fila para debugging."""
-        return f"Queue({list(self._items)})"
+        return f"{type(self).__name__}({list(self._items)})"
     
     def __len__(self):
-        """Permite usar len(fila)."""
-        return self.size()
+        """
+        Permite usar len(fila) e testes de verdade como `while fila:`.
+        
+        Chama len() da estrutura interna diretamente, sem passar por
+        size(). Sem __bool__ próprio, `if fila:` também usa este método:
+        uma fila vazia é falsa.
+        """
+        return len(self._items)
 
 
 if __name__ == "__main__":
@@ -7,6 +7,8 @@ Este módulo faz parte do artigo:
 Autores: Silveira et al. (2025)
 """
 
+from array import array
+
 
 class Stack:
     """
@@ -17,7 +19,9 @@ class Stack:
     
     Complexidade:
         - push(): O(1) amortizado
+        - push_many(): O(k) amortizado para k elementos
         - pop(): O(1)
+        - pop_n(): O(k) para k elementos
         - peek(): O(1)
         - is_empty(): O(1)
         - size(): O(1)
@@ -35,10 +39,33 @@ class Stack:
         10
     """
     
+    __slots__ = ('_items',)
+    
     def __init__(self):
         """Inicializa uma pilha vazia."""
         self._items = []
     
+    @classmethod
+    def from_iterable(cls, items):
+        """
+        Cria uma pilha já contendo os elementos do iterável.
+        
+        Os elementos são empilhados na ordem do iterável (o último fica
+        no topo), com uma única chamada a push_many().
+        
+        Args:
+            items: Iterável com os elementos iniciais
+        
+        Returns:
+            Stack: Nova pilha preenchida
+        
+        Complexity:
+            O(k) para k elementos
+        """
+        pilha = cls()
+        pilha.push_many(items)
+        return pilha
+    
     def push(self, item):
         """
         Adiciona um elemento no topo da pilha.
@@ -51,6 +78,21 @@ class Stack:
         """
         self._items.append(item)
     
+    def push_many(self, items):
+        """
+        Empilha vários elementos, na ordem do iterável (o último fica no topo).
+        
+        Equivale a chamar push() para cada elemento, mas o laço é
+        executado em C por list.extend().
+        
+        Args:
+            items: Iterável com os elementos a serem empilhados
+        
+        Complexity:
+            O(k) amortizado para k elementos
+        """
+        self._items.extend(items)
+    
     def pop(self):
         """
         Remove e retorna o elemento do topo da pilha.
@@ -64,10 +106,46 @@ class Stack:
         Complexity:
             O(1)
         """
-        if self.is_empty():
+        if not self._items:
             raise IndexError("Pop de pilha vazia")
         return self._items.pop()
     
+    def pop_n(self, n):
+        """
+        Remove e retorna os n elementos do topo, em ordem de remoção.
+        
+        Equivale a n chamadas a pop(), mas a pilha é cortada com um
+        único `del` de fatia. Se a pilha tiver menos de n elementos,
+        nada é removido.
+        
+        Args:
+            n (int): Quantidade de elementos a remover
+        
+        Returns:
+            list: Os elementos removidos, do topo para o fundo
+        
+        Raises:
+            ValueError: Se n for negativo
+            IndexError: Se a pilha tiver menos de n elementos
+        
+        Complexity:
+            O(k) para k elementos
+        
+        Examples:
+            >>> pilha = Stack.from_iterable([1, 2, 3])
+            >>> pilha.pop_n(2)
+            [3, 2]
+        """
+        if n < 0:
+            raise ValueError("n não pode ser negativo")
+        if n > len(self._items):
+            raise IndexError("pop_n maior que o tamanho da pilha")
+        if not n:
+            return []
+        removidos = list(reversed(self._items[-n:]))
+        del self._items[-n:]
+        return removidos
+    
     def peek(self):
         """
         Retorna o elemento do topo sem removê-lo.
@@ -81,7 +159,7 @@ class Stack:
         Complexity:
             O(1)
         """
-        if self.is_empty():
+        if not self._items:
             raise IndexError("Peek de pilha vazia")
         return self._items[-1]
     
@@ -95,7 +173,7 @@ class Stack:
         Complexity:
             O(1)
         """
-        return len(self._items) == 0
+        return not self._items
     
     def size(self):
         """
@@ -111,11 +189,75 @@ class Stack:
     
     def __repr__(self):
         """Representação em string da pilha para debugging."""
-        return f"Stack({self._items})"
+        return f"{type(self).__name__}({self._items})"
     
     def __len__(self):
-        """Permite usar len(pilha)."""
-        return self.size()
+        """
+        Permite usar len(pilha) e testes de verdade como `while pilha:`.
+        
+        Chama len() da estrutura interna diretamente, sem passar por
+        size(). Sem __bool__ próprio, `if pilha:` também usa este método:
+        uma pilha vazia é falsa.
+        """
+        return len(self._items)
+
+
+class IntStack(Stack):
+    """
+    Pilha especializada para inteiros, armazenados em um array('q').
+    
+    Mesma interface e mesmas complexidades de Stack, mas os elementos
+    ficam em um array de inteiros de 64 bits com sinal: 8 bytes por
+    elemento, em vez de um ponteiro (8 bytes) mais um objeto int
+    (28+ bytes) para cada valor fora do cache de inteiros pequenos.
+    Útil para pilhas grandes de dados numéricos (ex: ids de nós em uma
+    busca em profundidade).
+    
+    Restrições:
+        - push() de um valor que não é int levanta TypeError; de um
+          inteiro fora da faixa de 64 bits, OverflowError
+        - pop() e peek() devolvem novos objetos int, criados a partir
+          do valor armazenado
+    
+    Attributes:
+        _items (array): array('q') contendo os elementos da pilha
+    
+    Examples:
+        >>> pilha = IntStack()
+        >>> pilha.push(10)
+        >>> pilha.push(20)
+        >>> pilha.pop()
+        20
+        >>> pilha.push("a")
+        Traceback (most recent call last):
+        ...
+        TypeError: 'str' object cannot be interpreted as an integer
+    """
+    
+    __slots__ = ()
+    
+    def __init__(self):
+        """Inicializa uma pilha de inteiros vazia."""
+        self._items = array('q')
+    
+    def push_many(self, items):
+        """
+        Empilha vários inteiros, na ordem do iterável (o último fica no topo).
+        
+        Os valores são convertidos para um array('q') antes de entrar na
+        pilha: se algum não for int, nada é empilhado.
+        
+        Args:
+            items: Iterável de inteiros
+        
+        Raises:
+            TypeError: Se algum elemento não for int
+            OverflowError: Se algum inteiro não couber em 64 bits
+        
+        Complexity:
+            O(k) amortizado para k elementos
+        """
+        self._items.extend(array('q', items))
 
 
 if __name__ == "__main__":
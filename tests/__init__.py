@@ -13,6 +13,7 @@ Uso:
     python tests/test_stack.py
     python tests/test_queue.py
     python tests/test_hashtable.py
+    python tests/test_open_hashtable.py
 """
 
 __version__ = "1.0.0"
@@ -8,11 +8,20 @@ Artigo: "Implementação de Estruturas de Dados Lineares"
 Autores: Silveira et al. (2025)
 """
 
+import io
+import os
 import sys
-from pathlib import Path
+from contextlib import redirect_stdout
+from operator import itemgetter
 
-# Adicionar diretório src ao path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+# Linhas do relatório
+_SEPARADOR = "=" * 60
+_TRACEJADO = "-" * 60
+
+# Adicionar diretório src ao path (uma única vez por processo)
+SRC = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
 
 from hashtable import HashTable
 
@@ -43,7 +52,6 @@ def test_insert_search_delete():
     print(f"  Search: 'nome'→'{busca1}', 'idade'→{busca2}")
     print(f"  Delete: removeu 'idade'→{deleted}")
     print(f"  Search após delete: KeyError lançado corretamente")
-    return True
 
 
 def test_atualizacao_valor():
@@ -63,7 +71,6 @@ def test_atualizacao_valor():
     print(f"  Valor inicial: 'valor1'")
     print(f"  Após update: '{valor_final}'")
     print(f"  Count permaneceu: {count_depois} (não duplicou)")
-    return True
 
 
 def test_excecao_search():
@@ -73,12 +80,11 @@ def test_excecao_search():
     
     try:
         ht.search("nao_existe")
-        print("✗ FALHOU - Não lançou exceção")
-        return False
     except KeyError as e:
         print("✓ PASSOU")
         print(f"  Exceção lançada: {e}")
-        return True
+    else:
+        raise AssertionError("Não lançou exceção")
 
 
 def test_excecao_delete():
@@ -88,12 +94,11 @@ def test_excecao_delete():
     
     try:
         ht.delete("nao_existe")
-        print("✗ FALHOU - Não lançou exceção")
-        return False
     except KeyError as e:
         print("✓ PASSOU")
         print(f"  Exceção lançada: {e}")
-        return True
+    else:
+        raise AssertionError("Não lançou exceção")
 
 
 def test_colisoes():
@@ -123,7 +128,6 @@ def test_colisoes():
     print(f"  Inseridos: 25 elementos em tabela size=5")
     print(f"  Todos recuperáveis corretamente")
     print(f"  Count: {ht_pequena.count}")
-    return True
 
 
 def test_load_factor():
@@ -140,7 +144,6 @@ def test_load_factor():
     print("✓ PASSOU")
     print(f"  50 elementos em size=10")
     print(f"  Load factor: {lf} (correto: 50/10 = 5.0)")
-    return True
 
 
 def test_tipos_diversos():
@@ -162,7 +165,6 @@ def test_tipos_diversos():
     print(f"  Int key: {v1}")
     print(f"  String key: {v2}")
     print(f"  Tuple key: {v3}")
-    return True
 
 
 def test_grande_escala():
@@ -194,14 +196,99 @@ def test_grande_escala():
     print(f"  Todos recuperáveis: Sim")
     print(f"  Deletados: 500 elementos")
     print(f"  Count final: {count_final}")
-    return True
+
+
+def test_bulk_insert():
+    """Teste 9: Verifica que bulk_insert equivale a inserts individuais"""
+    print("\n[TESTE 9] Inserção em lote (bulk_insert)")
+    ht = HashTable(size=10)
+    ht.insert("key0", "antigo")
+    
+    ht.bulk_insert((f"key{i}", i) for i in range(100))
+    
+    valores_ok = all(ht.search(f"key{i}") == i for i in range(100))
+    
+    assert valores_ok and ht.count == 100, \
+        f"Valores ok: {valores_ok}, Count: {ht.count}"
+    print("✓ PASSOU")
+    print(f"  Inseridos em lote: 100 pares (1 chave já existente)")
+    print(f"  Valor existente atualizado: key0 → {ht.search('key0')}")
+    print(f"  Count: {ht.count} (não duplicou)")
+
+
+def test_clear_resize():
+    """Teste 10: Verifica clear() e resize() sem perda de elementos"""
+    print("\n[TESTE 10] clear() e resize()")
+    ht = HashTable(size=10)
+    for i in range(50):
+        ht.insert(f"key{i}", i)
+    
+    ht.resize(7)
+    valores_ok = all(ht.search(f"key{i}") == i for i in range(50))
+    distribuicao = ht.get_distribution()
+    
+    assert valores_ok and ht.size == 7 and len(distribuicao) == 7, \
+        f"Valores ok: {valores_ok}, Size: {ht.size}"
+    assert sum(distribuicao) == ht.count == 50, \
+        f"Distribuição: {distribuicao}, Count: {ht.count}"
+    
+    ht.clear()
+    assert ht.count == 0 and ht.size == 7 and "key0" not in ht, \
+        f"Count após clear: {ht.count}, Size: {ht.size}"
+    print("✓ PASSOU")
+    print(f"  resize(10 → 7): 50 elementos preservados")
+    print(f"  Distribuição após resize: {distribuicao.tolist()}")
+    print(f"  clear(): count = {ht.count}, size = {ht.size}")
+
+
+def test_crescimento_automatico():
+    """Teste 11: Verifica o crescimento automático com max_load_factor"""
+    print("\n[TESTE 11] Crescimento automático (max_load_factor)")
+    ht = HashTable(size=4, max_load_factor=0.75)
+    for i in range(100):
+        ht.insert(f"key{i}", i)
+    
+    ht_lote = HashTable(size=4, max_load_factor=0.75)
+    ht_lote.bulk_insert((f"key{i}", i) for i in range(100))
+    
+    valores_ok = all(ht.search(f"key{i}") == i == ht_lote.search(f"key{i}")
+                     for i in range(100))
+    
+    assert valores_ok and ht.size == ht_lote.size == 256, \
+        f"Valores ok: {valores_ok}, Size: {ht.size}, Size (lote): {ht_lote.size}"
+    assert ht.load_factor() <= 0.75 and HashTable(size=4).max_load_factor is None, \
+        f"Load factor: {ht.load_factor()}"
+    print("✓ PASSOU")
+    print(f"  100 elementos a partir de size=4: size = {ht.size}")
+    print(f"  Load factor final: {ht.load_factor():.2f} (limite 0.75)")
+    print(f"  bulk_insert cresce direto para size = {ht_lote.size}")
+
+
+def test_items_iter_repr():
+    """Teste 12: Verifica items(), iteração pelas chaves e o repr resumido"""
+    print("\n[TESTE 12] items(), __iter__ e __repr__")
+    ht = HashTable(size=7)
+    for i in range(20):
+        ht.insert(f"key{i}", i)
+    
+    pares = dict(ht.items())
+    chaves = set(ht)
+    texto = repr(ht)
+    
+    assert pares == {f"key{i}": i for i in range(20)} and chaves == set(pares), \
+        f"Pares: {len(pares)}, Chaves: {len(chaves)}"
+    assert texto.count(": ") == 5 and texto.endswith(", ...})"), \
+        f"Repr: {texto}"
+    print("✓ PASSOU")
+    print(f"  items(): {len(pares)} pares, iteração: {len(chaves)} chaves")
+    print(f"  repr: {texto}")
 
 
 def executar_todos_testes():
     """Executa todos os testes e gera relatório"""
-    print("="*60)
+    print(_SEPARADOR)
     print("TESTES FUNCIONAIS - HASHTABLE")
-    print("="*60)
+    print(_SEPARADOR)
     
     testes = [
         ("Insert/Search/Delete", test_insert_search_delete),
@@ -212,48 +299,61 @@ def executar_todos_testes():
         ("Load factor", test_load_factor),
         ("Tipos diversos", test_tipos_diversos),
         ("Grande escala (1000 elem)", test_grande_escala),
+        ("Inserção em lote", test_bulk_insert),
+        ("clear() e resize()", test_clear_resize),
+        ("Crescimento automático", test_crescimento_automatico),
+        ("items(), __iter__ e __repr__", test_items_iter_repr),
     ]
     
     resultados = []
     
     for nome, teste_func in testes:
         try:
-            resultado = teste_func()
-            resultados.append(("✓", nome, resultado))
+            teste_func()
+            resultados.append(("✓", nome, True))
         except Exception as e:
             print(f"✗ FALHOU - Exceção não esperada: {e}")
             resultados.append(("✗", nome, False))
     
     # RESUMO
-    print("\n" + "="*60)
+    print("\n" + _SEPARADOR)
     print("RESUMO DOS TESTES - HASHTABLE")
-    print("="*60)
+    print(_SEPARADOR)
     
+    # Uma única passada monta o resumo e as linhas da tabela do artigo
+    borda = "+--------------------------------+------------+"
+    linhas_resumo = []
+    linhas_artigo = ["| Teste                          | Resultado  |", borda]
     for simbolo, nome, passou in resultados:
-        print(f"{nome:30} {simbolo}")
+        linhas_resumo.append(f"{nome:30} {simbolo}")
+        linhas_artigo.append(f"| {nome:30} | {'✓':^10} |")
+    linhas_artigo.append(borda)
     
-    print("="*60)
+    print("\n".join(linhas_resumo))
+    print(_SEPARADOR)
     
-    total_passou = sum(1 for _, _, passou in resultados if passou)
+    total_passou = sum(map(itemgetter(2), resultados))  # True conta como 1
     total_testes = len(resultados)
     
     if total_passou == total_testes:
         print("✅ TODOS OS TESTES PASSARAM!")
         print("\n📋 TABELA PARA O ARTIGO:")
-        print("-"*60)
-        print("| Teste                          | Resultado  |")
-        print("+--------------------------------+------------+")
-        for _, nome, passou in resultados:
-            print(f"| {nome:30} | {'✓':^10} |")
-        print("+--------------------------------+------------+")
+        print(_TRACEJADO)
+        print("\n".join(linhas_artigo))
     else:
         print(f"⚠️  {total_passou}/{total_testes} testes passaram")
     
-    print("="*60)
+    print(_SEPARADOR)
     
     return total_passou == total_testes
 
 
 if __name__ == "__main__":
-    sucesso = executar_todos_testes()
+    # Acumula o relatório em memória e escreve tudo de uma vez no final
+    saida = io.StringIO()
+    try:
+        with redirect_stdout(saida):
+            sucesso = executar_todos_testes()
+    finally:
+        sys.stdout.write(saida.getvalue())
     sys.exit(0 if sucesso else 1)
@@ -0,0 +1,354 @@
+"""
+Testes Funcionais - Hashtable com Endereçamento Aberto
+
+Este módulo contém os testes funcionais para validar a corretude
+da implementação da Hashtable com endereçamento aberto.
+
+Artigo: "Implementação de Estruturas de Dados Lineares"
+Autores: Silveira et al. (2025)
+"""
+
+import io
+import os
+import sys
+from contextlib import redirect_stdout
+from operator import itemgetter
+
+# Linhas do relatório
+_SEPARADOR = "=" * 60
+_TRACEJADO = "-" * 60
+
+# Adicionar diretório src ao path (uma única vez por processo)
+SRC = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+from open_hashtable import IntHashTable, OpenAddressingHashTable
+
+
+def test_insert_search_delete():
+    """Teste 1: Verifica operações básicas de insert, search e delete"""
+    print("\n[TESTE 1] Insert/Search/Delete")
+    ht = OpenAddressingHashTable()
+    ht.insert("nome", "João")
+    ht.insert("idade", 25)
+    ht.insert("cidade", "SP")
+    
+    busca1 = ht.search("nome")
+    busca2 = ht.search("idade")
+    
+    deleted = ht.delete("idade")
+    
+    try:
+        ht.search("idade")
+        delete_ok = False
+    except KeyError:
+        delete_ok = True
+    
+    assert busca1 == "João" and busca2 == 25 and deleted == 25 and delete_ok, \
+        f"Valores: {busca1}, {busca2}, {deleted}, {delete_ok}"
+    print("✓ PASSOU")
+    print(f"  Search: 'nome'→'{busca1}', 'idade'→{busca2}")
+    print(f"  Delete: removeu 'idade'→{deleted}")
+    print(f"  Search após delete: KeyError lançado corretamente")
+
+
+def test_atualizacao_valor():
+    """Teste 2: Verifica atualização de valor existente"""
+    print("\n[TESTE 2] Atualização de valor existente")
+    ht = OpenAddressingHashTable()
+    ht.insert("key", "valor1")
+    ht.insert("key", "valor2")
+    valor_final = ht.search("key")
+    
+    assert valor_final == "valor2" and ht.count == 1, \
+        f"Valor: {valor_final}, Count: {ht.count}"
+    print("✓ PASSOU")
+    print(f"  Após update: '{valor_final}'")
+    print(f"  Count permaneceu: {ht.count} (não duplicou)")
+
+
+def test_excecoes():
+    """Teste 3: Verifica exceções em search e delete de chave inexistente"""
+    print("\n[TESTE 3] Exceções em search/delete de chave inexistente")
+    ht = OpenAddressingHashTable()
+    ht.insert("key", 1)
+    
+    excecoes = 0
+    for operacao in (ht.search, ht.delete):
+        try:
+            operacao("nao_existe")
+        except KeyError:
+            excecoes += 1
+    
+    assert excecoes == 2 and ht.count == 1, \
+        f"Exceções: {excecoes}, Count: {ht.count}"
+    print("✓ PASSOU")
+    print(f"  search() e delete() lançaram KeyError")
+
+
+def test_sondagem_apos_delete():
+    """Teste 4: Verifica que a busca atravessa lápides deixadas por delete"""
+    print("\n[TESTE 4] Sondagem após delete (lápides)")
+    ht = OpenAddressingHashTable(size=16)
+    
+    # Quatro chaves com o mesmo slot inicial
+    inicial = ht._hash_function(0)
+    a, b, c, d = [k for k in range(1000) if ht._hash_function(k) == inicial][:4]
+    for chave in (a, b, c):
+        ht.insert(chave, chave * 10)
+    
+    ht.delete(b)
+    busca_ok = ht.search(c) == c * 10 and b not in ht
+    
+    # A reinserção reaproveita a lápide e não duplica a chave c
+    ht.insert(d, d * 10)
+    ht.insert(c, -1)
+    
+    assert busca_ok and ht.count == 3 and ht.search(c) == -1, \
+        f"Busca ok: {busca_ok}, Count: {ht.count}"
+    print("✓ PASSOU")
+    print(f"  Chaves {a}, {b}, {c} no mesmo slot inicial ({inicial})")
+    print(f"  Chave {c} encontrada após remover {b} do meio da sequência")
+    print(f"  Reinserção após a lápide: count = {ht.count}")
+
+
+def test_crescimento_automatico():
+    """Teste 5: Verifica que a capacidade dobra mantendo α ≤ 0.7"""
+    print("\n[TESTE 5] Crescimento automático")
+    ht = OpenAddressingHashTable(size=5)
+    capacidade_inicial = ht.size
+    
+    for i in range(100):
+        ht.insert(f"key{i}", i)
+    
+    valores_ok = all(ht.search(f"key{i}") == i for i in range(100))
+    potencia_de_dois = ht.size & (ht.size - 1) == 0
+    
+    assert capacidade_inicial == 8 and potencia_de_dois and ht.load_factor() <= 0.7, \
+        f"Capacidade: {capacidade_inicial}→{ht.size}, α: {ht.load_factor()}"
+    assert valores_ok and ht.count == 100, \
+        f"Valores ok: {valores_ok}, Count: {ht.count}"
+    print("✓ PASSOU")
+    print(f"  size=5 arredondado para {capacidade_inicial}")
+    print(f"  100 elementos: capacidade {ht.size}, α = {ht.load_factor():.2f}")
+
+
+def test_tipos_diversos():
+    """Teste 6: Verifica suporte a tipos diversos como chave"""
+    print("\n[TESTE 6] Tipos diversos como chave")
+    ht = OpenAddressingHashTable()
+    
+    ht.insert(42, "int key")
+    ht.insert("string", "string key")
+    ht.insert((1, 2), "tuple key")
+    ht.insert(-1, "negative key")
+    
+    valores = [ht.search(42), ht.search("string"), ht.search((1, 2)), ht.search(-1)]
+    
+    assert valores == ["int key", "string key", "tuple key", "negative key"], \
+        f"Valores: {valores}"
+    print("✓ PASSOU")
+    print(f"  Int, string, tuple e int negativo recuperados")
+
+
+def test_grande_escala():
+    """Teste 7: Verifica inserções e remoções alternadas em grande escala"""
+    print("\n[TESTE 7] Operações em grande escala")
+    ht = OpenAddressingHashTable()
+    
+    for i in range(1000):
+        ht.insert(f"key{i}", i)
+    
+    for i in range(0, 1000, 2):
+        ht.delete(f"key{i}")
+    
+    # Novas inserções reaproveitam lápides e disparam reconstruções
+    for i in range(1000, 2000):
+        ht.insert(f"key{i}", i)
+    
+    restantes_ok = all(ht.search(f"key{i}") == i for i in range(1, 2000, 2))
+    removidos_ok = not any(f"key{i}" in ht for i in range(0, 1000, 2))
+    
+    assert restantes_ok and removidos_ok and ht.count == 1500, \
+        f"Restantes: {restantes_ok}, Removidos: {removidos_ok}, Count: {ht.count}"
+    print("✓ PASSOU")
+    print(f"  1000 inseridos, 500 removidos, mais 1000 inseridos")
+    print(f"  Count final: {ht.count}, capacidade: {ht.size}")
+
+
+def test_clear():
+    """Teste 8: Verifica clear() mantendo a capacidade"""
+    print("\n[TESTE 8] clear()")
+    ht = OpenAddressingHashTable()
+    for i in range(50):
+        ht.insert(i, i)
+    capacidade = ht.size
+    
+    ht.clear()
+    ht.insert("novo", 1)
+    
+    assert ht.count == 1 and ht.size == capacidade and 0 not in ht, \
+        f"Count: {ht.count}, Size: {ht.size}"
+    print("✓ PASSOU")
+    print(f"  clear(): capacidade mantida em {ht.size}")
+
+
+def test_int_hashtable():
+    """Teste 9: Verifica IntHashTable (chaves e valores em array('q'))"""
+    print("\n[TESTE 9] IntHashTable")
+    ht = IntHashTable()
+    
+    for i in range(1000):
+        ht.insert(i * 7, -i)
+    for i in range(0, 1000, 2):
+        ht.delete(i * 7)
+    
+    restantes_ok = all(ht.search(i * 7) == -i for i in range(1, 1000, 2))
+    removidos_ok = not any(i * 7 in ht for i in range(0, 1000, 2))
+    
+    assert restantes_ok and removidos_ok and ht.count == 500, \
+        f"Restantes: {restantes_ok}, Removidos: {removidos_ok}, Count: {ht.count}"
+    assert ht._keys.itemsize == 8 and len(ht._keys) == ht.size, \
+        f"Armazenamento: {type(ht._keys)}"
+    print("✓ PASSOU")
+    print(f"  1000 inseridos, 500 removidos: count = {ht.count}")
+    print(f"  Chaves e valores em array('q') de {ht.size} slots")
+
+
+def test_int_hashtable_tipos_invalidos():
+    """Teste 10: Verifica que IntHashTable rejeita não inteiros sem se alterar"""
+    print("\n[TESTE 10] IntHashTable com tipos inválidos")
+    ht = IntHashTable()
+    ht.insert(1, 10)
+    
+    erros = []
+    for chave, valor in (("nome", 1), (1.5, 1), (2, "valor"), (1, None), (2**70, 1)):
+        try:
+            ht.insert(chave, valor)
+        except (TypeError, OverflowError) as e:
+            erros.append(type(e).__name__)
+    
+    assert len(erros) == 5 and ht.count == 1 and ht.search(1) == 10, \
+        f"Erros: {erros}, Count: {ht.count}"
+    print("✓ PASSOU")
+    print(f"  Exceções: {', '.join(erros)}")
+    print(f"  Tabela intacta: count = {ht.count}, 1 → {ht.search(1)}")
+
+
+def test_items_iter_repr():
+    """Teste 11: Verifica items(), iteração pelas chaves e o repr resumido"""
+    print("\n[TESTE 11] items(), __iter__ e __repr__")
+    ht = OpenAddressingHashTable()
+    for i in range(20):
+        ht.insert(f"key{i}", i)
+    
+    pares = dict(ht.items())
+    chaves = set(ht)
+    texto = repr(ht)
+    
+    assert pares == {f"key{i}": i for i in range(20)} and chaves == set(pares), \
+        f"Pares: {len(pares)}, Chaves: {len(chaves)}"
+    assert texto.count(": ") == 5 and texto.endswith(", ...})"), \
+        f"Repr: {texto}"
+    print("✓ PASSOU")
+    print(f"  items(): {len(pares)} pares, iteração: {len(chaves)} chaves")
+    print(f"  repr: {texto}")
+
+
+def test_expected_size():
+    """Teste 12: Verifica o pré-dimensionamento (expected_size e from_dict)"""
+    print("\n[TESTE 12] Pré-dimensionamento (expected_size, from_dict)")
+    ht = OpenAddressingHashTable(expected_size=700)
+    capacidade = ht.size
+    for i in range(700):
+        ht.insert(i, i)
+    
+    dados = {f"key{i}": i for i in range(100)}
+    ht_dict = IntHashTable.from_dict({i: -i for i in range(100)})
+    ht_str = OpenAddressingHashTable.from_dict(dados)
+    
+    assert capacidade == ht.size == 1024 and ht.load_factor() <= 0.7, \
+        f"Capacidade: {capacidade}→{ht.size}"
+    assert dict(ht_str.items()) == dados and ht_dict.search(99) == -99, \
+        f"from_dict: {ht_str}"
+    assert isinstance(ht_dict, IntHashTable) and ht_dict.size == 256, \
+        f"Tipo: {type(ht_dict).__name__}, Size: {ht_dict.size}"
+    print("✓ PASSOU")
+    print(f"  expected_size=700: capacidade {capacidade}, sem reconstrução")
+    print(f"  from_dict (100 pares): capacidade {ht_str.size}")
+
+
+def executar_todos_testes():
+    """Executa todos os testes e gera relatório"""
+    print(_SEPARADOR)
+    print("TESTES FUNCIONAIS - HASHTABLE (ENDEREÇAMENTO ABERTO)")
+    print(_SEPARADOR)
+    
+    testes = [
+        ("Insert/Search/Delete", test_insert_search_delete),
+        ("Atualização de valor", test_atualizacao_valor),
+        ("Exceções search/delete", test_excecoes),
+        ("Sondagem após delete", test_sondagem_apos_delete),
+        ("Crescimento automático", test_crescimento_automatico),
+        ("Tipos diversos", test_tipos_diversos),
+        ("Grande escala (2000 elem)", test_grande_escala),
+        ("clear()", test_clear),
+        ("IntHashTable", test_int_hashtable),
+        ("IntHashTable tipos inválidos", test_int_hashtable_tipos_invalidos),
+        ("items(), __iter__ e __repr__", test_items_iter_repr),
+        ("Pré-dimensionamento", test_expected_size),
+    ]
+    
+    resultados = []
+    
+    for nome, teste_func in testes:
+        try:
+            teste_func()
+            resultados.append(("✓", nome, True))
+        except Exception as e:
+            print(f"✗ FALHOU - Exceção não esperada: {e}")
+            resultados.append(("✗", nome, False))
+    
+    # RESUMO
+    print("\n" + _SEPARADOR)
+    print("RESUMO DOS TESTES - HASHTABLE (ENDEREÇAMENTO ABERTO)")
+    print(_SEPARADOR)
+    
+    # Uma única passada monta o resumo e as linhas da tabela do artigo
+    borda = "+--------------------------------+------------+"
+    linhas_resumo = []
+    linhas_artigo = ["| Teste                          | Resultado  |", borda]
+    for simbolo, nome, passou in resultados:
+        linhas_resumo.append(f"{nome:30} {simbolo}")
+        linhas_artigo.append(f"| {nome:30} | {'✓':^10} |")
+    linhas_artigo.append(borda)
+    
+    print("\n".join(linhas_resumo))
+    print(_SEPARADOR)
+    
+    total_passou = sum(map(itemgetter(2), resultados))  # True conta como 1
+    total_testes = len(resultados)
+    
+    if total_passou == total_testes:
+        print("✅ TODOS OS TESTES PASSARAM!")
+        print("\n📋 TABELA PARA O ARTIGO:")
+        print(_TRACEJADO)
+        print("\n".join(linhas_artigo))
+    else:
+        print(f"⚠️  {total_passou}/{total_testes} testes passaram")
+    
+    print(_SEPARADOR)
+    
+    return total_passou == total_testes
+
+
+if __name__ == "__main__":
+    # Acumula o relatório em memória e escreve tudo de uma vez no final
+    saida = io.StringIO()
+    try:
+        with redirect_stdout(saida):
+            sucesso = executar_todos_testes()
+    finally:
+        sys.stdout.write(saida.getvalue())
+    sys.exit(0 if sucesso else 1)
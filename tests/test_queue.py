@@ -8,11 +8,20 @@ Artigo: "Implementação de Estruturas de Dados Lineares"
 Autores: Silveira et al. (2025)
 """
 
+import io
+import os
 import sys
-from pathlib import Path
+from contextlib import redirect_stdout
+from operator import itemgetter
 
-# Adicionar diretório src ao path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+# Linhas do relatório
+_SEPARADOR = "=" * 60
+_TRACEJADO = "-" * 60
+
+# Adicionar diretório src ao path (uma única vez por processo)
+SRC = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
 
 from queue import Queue
 
@@ -33,7 +42,6 @@ def test_enqueue_dequeue_fifo():
     print("✓ PASSOU")
     print(f"  Enfileirou: A, B, C")
     print(f"  Desenfileirou: {r1}, {r2}, {r3} (ordem FIFO correta)")
-    return True
 
 
 def test_excecao_fila_vazia():
@@ -43,12 +51,11 @@ def test_excecao_fila_vazia():
     
     try:
         fila_vazia.dequeue()
-        print("✗ FALHOU - Não lançou exceção")
-        return False
     except IndexError as e:
         print("✓ PASSOU")
         print(f"  Exceção lançada: {e}")
-        return True
+    else:
+        raise AssertionError("Não lançou exceção")
 
 
 def test_front_nao_remove():
@@ -67,7 +74,6 @@ def test_front_nao_remove():
     print("✓ PASSOU")
     print(f"  Front retornou: {f1}, {f2}, {f3}")
     print(f"  Tamanho permaneceu: {tamanho}")
-    return True
 
 
 def test_is_empty():
@@ -87,7 +93,6 @@ def test_is_empty():
     print(f"  Fila nova: vazia = {vazio1}")
     print(f"  Após enqueue: vazia = {vazio2}")
     print(f"  Após dequeue: vazia = {vazio3}")
-    return True
 
 
 def test_escalabilidade():
@@ -103,7 +108,6 @@ def test_escalabilidade():
     print("✓ PASSOU")
     print(f"  Inseridos: 10.000 elementos")
     print(f"  Tamanho: {tamanho_final}")
-    return True
 
 
 def test_operacoes_intercaladas():
@@ -121,14 +125,64 @@ def test_operacoes_intercaladas():
     print("✓ PASSOU")
     print(f"  Sequência: enqueue(1,2), dequeue, enqueue(3), dequeue(2x)")
     print(f"  Resultados: {d1}, {d2}, {d3} (correto)")
-    return True
+
+
+def test_enqueue_many():
+    """Teste 7: Verifica que enqueue_many preserva a ordem FIFO"""
+    print("\n[TESTE 7] Enqueue em lote (enqueue_many)")
+    fila = Queue()
+    fila.enqueue(0)
+    fila.enqueue_many(range(1, 100))
+    
+    removidos = [fila.dequeue() for _ in range(100)]
+    
+    assert removidos == list(range(100)) and fila.is_empty(), \
+        f"Primeiros: {removidos[:5]} | Vazia: {fila.is_empty()}"
+    print("✓ PASSOU")
+    print(f"  Enfileirados: 1 + 99 em lote")
+    print(f"  Ordem de saída: {removidos[:3]} ... {removidos[-1]} (FIFO)")
+
+
+def test_from_iterable():
+    """Teste 8: Verifica a criação de fila a partir de um iterável"""
+    print("\n[TESTE 8] Criação a partir de iterável (from_iterable)")
+    fila = Queue.from_iterable(range(10))
+    
+    frente = fila.front()
+    tamanho = fila.size()
+    
+    assert isinstance(fila, Queue) and frente == 0 and tamanho == 10, \
+        f"Frente: {frente} | Tamanho: {tamanho}"
+    print("✓ PASSOU")
+    print(f"  Queue.from_iterable(range(10))")
+    print(f"  Frente: {frente} (primeiro elemento), Tamanho: {tamanho}")
+
+
+def test_maxlen():
+    """Teste 9: Verifica o descarte da frente em fila limitada (maxlen)"""
+    print("\n[TESTE 9] Fila limitada (maxlen)")
+    fila = Queue(maxlen=3)
+    for i in range(5):
+        fila.enqueue(i)
+    
+    frente = fila.front()
+    tamanho = fila.size()
+    janela = Queue.from_iterable(range(10), maxlen=4)
+    
+    assert frente == 2 and tamanho == 3 and fila.maxlen == 3, \
+        f"Frente: {frente} | Tamanho: {tamanho} | maxlen: {fila.maxlen}"
+    assert janela.dequeue() == 6 and janela.size() == 3 and Queue().maxlen is None, \
+        f"Janela: {janela}"
+    print("✓ PASSOU")
+    print(f"  Queue(maxlen=3) após enfileirar 0..4: frente = {frente}")
+    print(f"  from_iterable(range(10), maxlen=4) manteve os 4 últimos")
 
 
 def executar_todos_testes():
     """Executa todos os testes e gera relatório"""
-    print("="*60)
+    print(_SEPARADOR)
     print("TESTES FUNCIONAIS - FILA")
-    print("="*60)
+    print(_SEPARADOR)
     
     testes = [
         ("Enqueue/Dequeue FIFO", test_enqueue_dequeue_fifo),
@@ -137,48 +191,60 @@ def executar_todos_testes():
         ("is_empty", test_is_empty),
         ("10.000 elementos", test_escalabilidade),
         ("Operações intercaladas", test_operacoes_intercaladas),
+        ("Enqueue em lote", test_enqueue_many),
+        ("from_iterable", test_from_iterable),
+        ("Fila limitada (maxlen)", test_maxlen),
     ]
     
     resultados = []
     
     for nome, teste_func in testes:
         try:
-            resultado = teste_func()
-            resultados.append(("✓", nome, resultado))
+            teste_func()
+            resultados.append(("✓", nome, True))
         except Exception as e:
             print(f"✗ FALHOU - Exceção não esperada: {e}")
             resultados.append(("✗", nome, False))
     
     # RESUMO
-    print("\n" + "="*60)
+    print("\n" + _SEPARADOR)
     print("RESUMO DOS TESTES - FILA")
-    print("="*60)
+    print(_SEPARADOR)
     
+    # Uma única passada monta o resumo e as linhas da tabela do artigo
+    borda = "+--------------------------------+------------+"
+    linhas_resumo = []
+    linhas_artigo = ["| Teste                          | Resultado  |", borda]
     for simbolo, nome, passou in resultados:
-        print(f"{nome:30} {simbolo}")
+        linhas_resumo.append(f"{nome:30} {simbolo}")
+        linhas_artigo.append(f"| {nome:30} | {'✓':^10} |")
+    linhas_artigo.append(borda)
     
-    print("="*60)
+    print("\n".join(linhas_resumo))
+    print(_SEPARADOR)
     
-    total_passou = sum(1 for _, _, passou in resultados if passou)
+    total_passou = sum(map(itemgetter(2), resultados))  # True conta como 1
     total_testes = len(resultados)
     
     if total_passou == total_testes:
         print("✅ TODOS OS TESTES PASSARAM!")
         print("\n📋 TABELA PARA O ARTIGO:")
-        print("-"*60)
-        print("| Teste                          | Resultado  |")
-        print("+--------------------------------+------------+")
-        for _, nome, passou in resultados:
-            print(f"| {nome:30} | {'✓':^10} |")
-        print("+--------------------------------+------------+")
+        print(_TRACEJADO)
+        print("\n".join(linhas_artigo))
     else:
         print(f"⚠️  {total_passou}/{total_testes} testes passaram")
     
-    print("="*60)
+    print(_SEPARADOR)
     
     return total_passou == total_testes
 
 
 if __name__ == "__main__":
-    sucesso = executar_todos_testes()
+    # Acumula o relatório em memória e escreve tudo de uma vez no final
+    saida = io.StringIO()
+    try:
+        with redirect_stdout(saida):
+            sucesso = executar_todos_testes()
+    finally:
+        sys.stdout.write(saida.getvalue())
     sys.exit(0 if sucesso else 1)
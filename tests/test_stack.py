@@ -8,13 +8,22 @@ Artigo: "Implementação de Estruturas de Dados Lineares"
 Autores: Silveira et al. (2025)
 """
 
+import io
+import os
 import sys
-from pathlib import Path
+from contextlib import redirect_stdout
+from operator import itemgetter
 
-# Adicionar diretório src ao path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+# Linhas do relatório
+_SEPARADOR = "=" * 60
+_TRACEJADO = "-" * 60
 
-from stack import Stack
+# Adicionar diretório src ao path (uma única vez por processo)
+SRC = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+from stack import IntStack, Stack
 
 
 def test_push_pop_lifo():
@@ -25,15 +34,13 @@ def test_push_pop_lifo():
     pilha.push(2)
     pilha.push(3)
     
-    r1 = pilha.pop()
-    r2 = pilha.pop()
-    r3 = pilha.pop()
+    r1, r2, r3 = pilha.pop_n(3)
     
-    assert r1 == 3 and r2 == 2 and r3 == 1, f"Esperado: 3,2,1 | Obtido: {r1},{r2},{r3}"
+    assert r1 == 3 and r2 == 2 and r3 == 1 and pilha.is_empty(), \
+        f"Esperado: 3,2,1 | Obtido: {r1},{r2},{r3}"
     print("✓ PASSOU")
     print(f"  Empilhou: 1, 2, 3")
     print(f"  Desempilhou: {r1}, {r2}, {r3} (ordem LIFO correta)")
-    return True
 
 
 def test_excecao_pilha_vazia():
@@ -43,12 +50,11 @@ def test_excecao_pilha_vazia():
     
     try:
         pilha_vazia.pop()
-        print("✗ FALHOU - Não lançou exceção")
-        return False
     except IndexError as e:
         print("✓ PASSOU")
         print(f"  Exceção lançada: {e}")
-        return True
+    else:
+        raise AssertionError("Não lançou exceção")
 
 
 def test_peek_nao_remove():
@@ -67,7 +73,6 @@ def test_peek_nao_remove():
     print("✓ PASSOU")
     print(f"  Peek retornou: {p1}, {p2}, {p3}")
     print(f"  Tamanho permaneceu: {tamanho}")
-    return True
 
 
 def test_is_empty():
@@ -87,7 +92,6 @@ def test_is_empty():
     print(f"  Pilha nova: vazia = {vazio1}")
     print(f"  Após push: vazia = {vazio2}")
     print(f"  Após pop: vazia = {vazio3}")
-    return True
 
 
 def test_escalabilidade():
@@ -95,15 +99,21 @@ def test_escalabilidade():
     print("\n[TESTE 5] Suporta 10.000 elementos")
     pilha = Stack()
     
-    for i in range(10000):
-        pilha.push(i)
+    # Lote único: o crescimento da lista fica no C, sem 10.000 chamadas a push()
+    pilha.push_many(range(10000))
+    
+    # Mesmo volume em IntStack: 8 bytes por elemento no array('q')
+    inteiros = IntStack.from_iterable(range(10000))
     
     tamanho_final = pilha.size()
-    assert tamanho_final == 10000, f"Esperado: 10000 | Obtido: {tamanho_final}"
+    assert tamanho_final == 10000 and pilha.peek() == 9999, \
+        f"Esperado: 10000 | Obtido: {tamanho_final}"
+    assert inteiros.size() == 10000 and inteiros.peek() == 9999, \
+        f"IntStack: {inteiros.size()} elementos"
     print("✓ PASSOU")
-    print(f"  Inseridos: 10.000 elementos")
-    print(f"  Tamanho: {tamanho_final}")
-    return True
+    print(f"  Inseridos: 10.000 elementos (push_many)")
+    print(f"  Tamanho: {tamanho_final} (Stack e IntStack)")
+    print(f"  Armazenamento IntStack: {inteiros._items.itemsize * 10000 // 1024} KB")
 
 
 def test_peek_excecao_vazio():
@@ -113,19 +123,104 @@ def test_peek_excecao_vazio():
     
     try:
         pilha_vazia.peek()
-        print("✗ FALHOU - Não lançou exceção")
-        return False
     except IndexError as e:
         print("✓ PASSOU")
         print(f"  Exceção lançada: {e}")
-        return True
+    else:
+        raise AssertionError("Não lançou exceção")
+
+
+def test_push_many():
+    """Teste 7: Verifica que push_many preserva a ordem LIFO"""
+    print("\n[TESTE 7] Push em lote (push_many)")
+    pilha = Stack()
+    pilha.push(0)
+    pilha.push_many(range(1, 100))
+    
+    removidos = [pilha.pop() for _ in range(100)]
+    
+    assert removidos == list(range(99, -1, -1)) and pilha.is_empty(), \
+        f"Primeiros: {removidos[:5]} | Vazia: {pilha.is_empty()}"
+    print("✓ PASSOU")
+    print(f"  Empilhados: 1 + 99 em lote")
+    print(f"  Ordem de saída: {removidos[:3]} ... {removidos[-1]} (LIFO)")
+
+
+def test_from_iterable():
+    """Teste 8: Verifica a criação de pilha a partir de um iterável"""
+    print("\n[TESTE 8] Criação a partir de iterável (from_iterable)")
+    pilha = Stack.from_iterable(range(10))
+    
+    topo = pilha.peek()
+    tamanho = pilha.size()
+    
+    assert isinstance(pilha, Stack) and topo == 9 and tamanho == 10, \
+        f"Topo: {topo} | Tamanho: {tamanho}"
+    print("✓ PASSOU")
+    print(f"  Stack.from_iterable(range(10))")
+    print(f"  Topo: {topo} (último elemento), Tamanho: {tamanho}")
+
+
+def test_int_stack():
+    """Teste 9: Verifica IntStack (inteiros em array('q'))"""
+    print("\n[TESTE 9] Pilha de inteiros (IntStack)")
+    pilha = IntStack.from_iterable(range(5))
+    pilha.push(-2**63)
+    
+    topo = pilha.pop()
+    
+    erros = []
+    for valores in (["a"], [1.5], [6, 7, None], [2**64]):
+        try:
+            pilha.push_many(valores)
+        except (TypeError, OverflowError) as e:
+            erros.append(type(e).__name__)
+    
+    assert topo == -2**63 and pilha.peek() == 4 and pilha.size() == 5, \
+        f"Topo: {topo} | Peek: {pilha.peek()} | Tamanho: {pilha.size()}"
+    assert len(erros) == 4 and isinstance(pilha, Stack), \
+        f"Erros: {erros}"
+    print("✓ PASSOU")
+    print(f"  IntStack.from_iterable(range(5)), push/pop de {topo}")
+    print(f"  Valores inválidos rejeitados: {', '.join(erros)}")
+    print(f"  Pilha intacta: {pilha}")
+
+
+def test_pop_n():
+    """Teste 10: Verifica pop_n (remoção em lote, tudo ou nada)"""
+    print("\n[TESTE 10] Pop em lote (pop_n)")
+    pilha = Stack.from_iterable(range(10))
+    
+    lote = pilha.pop_n(4)
+    vazio = pilha.pop_n(0)
+    try:
+        pilha.pop_n(7)
+    except IndexError as e:
+        erro = e
+    else:
+        raise AssertionError("pop_n(7) não lançou exceção")
+    tamanho = pilha.size()
+    
+    inteiros = IntStack.from_iterable(range(3))
+    lote_int = inteiros.pop_n(3)
+    
+    assert lote == [9, 8, 7, 6] and vazio == [], \
+        f"Lote: {lote} | Vazio: {vazio}"
+    assert tamanho == 6 and pilha.peek() == 5, \
+        f"Tamanho após falha: {tamanho} | Topo: {pilha.peek()}"
+    assert lote_int == [2, 1, 0] and inteiros.is_empty(), \
+        f"IntStack: {lote_int}"
+    print("✓ PASSOU")
+    print(f"  pop_n(4) = {lote}")
+    print(f"  pop_n(7) com 6 elementos: {erro} (nada removido)")
+    print(f"  IntStack.pop_n(3) = {lote_int}")
 
 
 def executar_todos_testes():
     """Executa todos os testes e gera relatório"""
-    print("="*60)
+    print(_SEPARADOR)
     print("TESTES FUNCIONAIS - PILHA")
-    print("="*60)
+    print(_SEPARADOR)
     
     testes = [
         ("Push/Pop LIFO", test_push_pop_lifo),
@@ -134,48 +229,61 @@ def executar_todos_testes():
         ("is_empty", test_is_empty),
         ("10.000 elementos", test_escalabilidade),
         ("Exceção peek vazio", test_peek_excecao_vazio),
+        ("Push em lote", test_push_many),
+        ("from_iterable", test_from_iterable),
+        ("Pilha de inteiros", test_int_stack),
+        ("Pop em lote", test_pop_n),
     ]
     
     resultados = []
     
     for nome, teste_func in testes:
         try:
-            resultado = teste_func()
-            resultados.append(("✓", nome, resultado))
+            teste_func()
+            resultados.append(("✓", nome, True))
         except Exception as e:
             print(f"✗ FALHOU - Exceção não esperada: {e}")
             resultados.append(("✗", nome, False))
     
     # RESUMO
-    print("\n" + "="*60)
+    print("\n" + _SEPARADOR)
     print("RESUMO DOS TESTES - PILHA")
-    print("="*60)
+    print(_SEPARADOR)
     
+    # Uma única passada monta o resumo e as linhas da tabela do artigo
+    borda = "+--------------------------------+------------+"
+    linhas_resumo = []
+    linhas_artigo = ["| Teste                          | Resultado  |", borda]
     for simbolo, nome, passou in resultados:
-        print(f"{nome:30} {simbolo}")
+        linhas_resumo.append(f"{nome:30} {simbolo}")
+        linhas_artigo.append(f"| {nome:30} | {'✓':^10} |")
+    linhas_artigo.append(borda)
     
-    print("="*60)
+    print("\n".join(linhas_resumo))
+    print(_SEPARADOR)
     
-    total_passou = sum(1 for _, _, passou in resultados if passou)
+    total_passou = sum(map(itemgetter(2), resultados))  # True conta como 1
     total_testes = len(resultados)
     
     if total_passou == total_testes:
         print("✅ TODOS OS TESTES PASSARAM!")
         print("\n📋 TABELA PARA O ARTIGO:")
-        print("-"*60)
-        print("| Teste                          | Resultado  |")
-        print("+--------------------------------+------------+")
-        for _, nome, passou in resultados:
-            print(f"| {nome:30} | {'✓':^10} |")
-        print("+--------------------------------+------------+")
+        print(_TRACEJADO)
+        print("\n".join(linhas_artigo))
     else:
         print(f"⚠️  {total_passou}/{total_testes} testes passaram")
     
-    print("="*60)
+    print(_SEPARADOR)
     
     return total_passou == total_testes
 
 
 if __name__ == "__main__":
-    sucesso = executar_todos_testes()
+    # Acumula o relatório em memória e escreve tudo de uma vez no final
+    saida = io.StringIO()
+    try:
+        with redirect_stdout(saida):
+            sucesso = executar_todos_testes()
+    finally:
+        sys.stdout.write(saida.getvalue())
     sys.exit(0 if sucesso else 1)